@@ -20,6 +20,26 @@ from pydgey import (
 )
 
 
+# Mixing table, built once at import rather than per run.
+_COLOR_MIXES = {
+    frozenset(["Red", "Blue"]): ("Purple", "🟣"),
+    frozenset(["Red", "Yellow"]): ("Orange", "🟠"),
+    frozenset(["Blue", "Yellow"]): ("Green", "🟢"),
+    frozenset(["Red", "Blue", "Yellow"]): ("Brown", "🟤"),
+    frozenset(["Red"]): ("Red", "🔴"),
+    frozenset(["Blue"]): ("Blue", "🔵"),
+    frozenset(["Yellow"]): ("Yellow", "🟡"),
+}
+_DEFAULT_MIX = ("Gray", "⚫")
+
+# Map UI options straight to color names, one dict lookup per selection.
+_COLOR_TOKENS = {
+    "🔴 Red": "Red",
+    "🔵 Blue": "Blue",
+    "🟡 Yellow": "Yellow",
+}
+
+
 class ColorMixerPipeline(Pipeline):
     """
     A Pydgey feature showcase through color mixing.
@@ -273,33 +293,14 @@ class ColorMixerPipeline(Pipeline):
     def run(self, params, logger: PipelineLogger) -> bool:
         """Execute the color mixing pipeline."""
 
-        def check_abort():
-            if self.is_stopped:
-                logger.warning("Pipeline aborted by user")
-                return True
-            return False
-
         def sleep(seconds: float) -> bool:
             """Interruptible sleep - returns True if aborted."""
-            interval = 0.1  # Check every 100ms
-            elapsed = 0.0
-            while elapsed < seconds:
-                if self.is_stopped:
-                    return True
-                time.sleep(min(interval, seconds - elapsed))
-                elapsed += interval
-            return False
+            # Blocks in the kernel and wakes immediately on terminate().
+            return self._stop_event.wait(seconds)
 
         # Parse color selections
         raw_colors = params.get("colors", [])
-        colors = set()
-        for c in raw_colors:
-            if "Red" in c:
-                colors.add("Red")
-            elif "Blue" in c:
-                colors.add("Blue")
-            elif "Yellow" in c:
-                colors.add("Yellow")
+        colors = {_COLOR_TOKENS[c] for c in raw_colors if c in _COLOR_TOKENS}
 
         project_name = params.get("project_name", "Untitled")
 
@@ -312,42 +313,35 @@ class ColorMixerPipeline(Pipeline):
                 logger.warning("No colors selected - using default (Red)")
                 colors = {"Red"}
 
-            sleep(0.5)
+            sorted_colors = sorted(colors)
+
+            if sleep(0.5):
+                return False
             logger.info(f"Selected {len(colors)} primary color(s):")
-            for color in sorted(colors):
+            for color in sorted_colors:
                 logger.indent(f"• {color}")
-                sleep(0.4)
-            sleep(0.3)
+                if sleep(0.4):
+                    return False
+            if sleep(0.3):
+                return False
             step.message = f"{len(colors)} colors ready"
 
-        if check_abort():
-            return False
-
         # ===== Stage 2: Mixing =====
         logger.stage("Pigment Mixing")
 
         with self.progress.step("Mixing Pigments") as step:
-            color_mixes = {
-                frozenset(["Red", "Blue"]): ("Purple", "🟣"),
-                frozenset(["Red", "Yellow"]): ("Orange", "🟠"),
-                frozenset(["Blue", "Yellow"]): ("Green", "🟢"),
-                frozenset(["Red", "Blue", "Yellow"]): ("Brown", "🟤"),
-                frozenset(["Red"]): ("Red", "🔴"),
-                frozenset(["Blue"]): ("Blue", "🔵"),
-                frozenset(["Yellow"]): ("Yellow", "🟡"),
-            }
-
-            result_name, result_emoji = color_mixes.get(
-                frozenset(colors), ("Gray", "⚫")
+            result_name, result_emoji = _COLOR_MIXES.get(
+                frozenset(colors), _DEFAULT_MIX
             )
 
             logger.step("Combining pigments...")
-            sleep(0.8)
-            logger.command(f"mix --colors {','.join(sorted(colors))}")
-            sleep(1.0)
+            if sleep(0.8):
+                return False
+            logger.command(f"mix --colors {','.join(sorted_colors)}")
+            if sleep(1.0):
+                return False
             logger.info("Calculating color ratios...")
-            sleep(0.6)
-            if check_abort():
+            if sleep(0.6):
                 return False
             step.message = f"Base: {result_name}"
 
@@ -373,18 +367,22 @@ class ColorMixerPipeline(Pipeline):
             opacity = params.get("opacity", 1.0)
 
             logger.info(f"Saturation: {saturation}%")
-            sleep(0.4)
+            if sleep(0.4):
+                return False
             logger.info(f"Opacity: {opacity}")
-            sleep(0.4)
+            if sleep(0.4):
+                return False
 
             if params.get("enable_gradient"):
                 grad_type = params.get("gradient_type", "Linear")
                 grad_angle = params.get("gradient_angle", 45)
                 modifiers.append(f"{grad_type} Gradient")
                 logger.info(f"Gradient: {grad_type} at {grad_angle}°")
-                sleep(0.5)
+                if sleep(0.5):
+                    return False
 
-            sleep(0.5)
+            if sleep(0.5):
+                return False
 
             modifier_str = " ".join(modifiers)
             final_color = (
@@ -394,9 +392,6 @@ class ColorMixerPipeline(Pipeline):
 
         logger.success(f"{result_emoji} Final Result: {final_color}")
 
-        if check_abort():
-            return False
-
         # ===== Stage 4: Output =====
         logger.stage("Generating Output")
 
@@ -406,33 +401,38 @@ class ColorMixerPipeline(Pipeline):
             output_dir.mkdir(parents=True, exist_ok=True)
 
             logger.info("Creating result file...")
-            sleep(0.6)
+            if sleep(0.6):
+                return False
 
             result_file = output_dir / f"{output_prefix}_result.txt"
-            with open(result_file, "w") as f:
-                f.write("🎨 Color Mix Result\n")
-                f.write(f"{'=' * 40}\n\n")
-                f.write(f"Project: {project_name}\n")
-                f.write(f"Input Colors: {', '.join(sorted(colors))}\n")
-                f.write(f"Intensity: {intensity}\n")
-                f.write(f"Saturation: {saturation}%\n")
-                f.write(f"Opacity: {opacity}\n\n")
-                f.write(f"Result: {result_emoji} {final_color}\n")
-
-                if notes := params.get("notes"):
-                    f.write(f"\nNotes:\n{notes}\n")
+            payload = (
+                "🎨 Color Mix Result\n"
+                f"{'=' * 40}\n\n"
+                f"Project: {project_name}\n"
+                f"Input Colors: {', '.join(sorted_colors)}\n"
+                f"Intensity: {intensity}\n"
+                f"Saturation: {saturation}%\n"
+                f"Opacity: {opacity}\n\n"
+                f"Result: {result_emoji} {final_color}\n"
+            )
+            if notes := params.get("notes"):
+                payload += f"\nNotes:\n{notes}\n"
+            result_file.write_text(payload)
 
             logger.success(f"Saved: {result_file}")
-            sleep(0.5)
+            if sleep(0.5):
+                return False
 
             # Bundle results
             logger.info("Packaging results...")
-            sleep(0.4)
+            if sleep(0.4):
+                return False
             bundle = ResultBundle(output_prefix, base_dir=output_dir)
             bundle.add_file(result_file.name, description="Color Mix Result")
 
             zip_path = bundle.create_zip()
-            sleep(0.5)
+            if sleep(0.5):
+                return False
             if zip_path:
                 logger.info(f"📦 Download ready: {zip_path.name}")
 
@@ -40,14 +40,13 @@ export const PipelineWidget: React.FC = () => {
 
     // --- Logic ---
 
-    // Polling Effect
+    // Polling Effect. offsetRef tracks the backend's absolute log
+    // offset (not localLogs.length: once the backend evicts old
+    // history the two diverge). Every poll reply carries new_offset,
+    // so a drifted value self-corrects within one poll.
     const offsetRef = React.useRef(0);
     const isRunningRef = React.useRef(false);
 
-    useEffect(() => {
-        offsetRef.current = localLogs.length;
-    }, [localLogs]);
-
     // Keep ref in sync with state
     useEffect(() => {
         isRunningRef.current = statusState === "running";
@@ -86,12 +85,15 @@ export const PipelineWidget: React.FC = () => {
         const handleMsg = (msg: WidgetMessage) => {
             if (msg.type === "log_batch") {
                 if (msg.content) {
-                    // Append new content, update offset
-                    setLocalLogs(prev => {
-                        const newLogs = prev + msg.content;
-                        offsetRef.current = newLogs.length;
-                        return newLogs;
-                    });
+                    setLocalLogs(prev => prev + msg.content);
+                    // Pushed batches carry no new_offset; advance by
+                    // the delta so the next poll skips these bytes.
+                    offsetRef.current += msg.content.length;
+                }
+                if (typeof msg.new_offset === "number") {
+                    // Poll replies are authoritative: adopting the
+                    // backend offset resyncs after eviction or drift.
+                    offsetRef.current = msg.new_offset;
                 }
                 if (msg.status) {
                     setStatusState(msg.status);
@@ -100,8 +102,14 @@ export const PipelineWidget: React.FC = () => {
                 // Final sync - use complete logs from backend
                 if (msg.logs) {
                     setLocalLogs(msg.logs);
-                    offsetRef.current = msg.logs.length;
                 }
+                // The snapshot may be truncated, so its length is not
+                // the absolute offset; without log_offset, park high
+                // and let the next poll reply correct it.
+                offsetRef.current =
+                    typeof msg.log_offset === "number"
+                        ? msg.log_offset
+                        : Number.MAX_SAFE_INTEGER;
                 if (msg.status) setStatusState(msg.status);
             }
         };
@@ -125,14 +133,18 @@ export const PipelineWidget: React.FC = () => {
         } else if (!isRunning && logs && logs !== localLogs) {
             // Only sync from traitlet when idle (avoids duplicate with message push)
             setLocalLogs(logs);
-            offsetRef.current = logs.length;
+            // The traitlet mirrors only a tail, so its length says
+            // nothing about the absolute offset; park high and let the
+            // next poll reply correct it.
+            offsetRef.current = Number.MAX_SAFE_INTEGER;
         }
     }, [logs, isRunning, localLogs]);
 
 
     const handleRun = () => {
         setLocalLogs("");
-        setStatusState("running"); 
+        offsetRef.current = 0; // backend clears its history on run start
+        setStatusState("running");
         setRunRequested(true);
         model.save_changes();
     };
@@ -23,12 +23,16 @@ export type StatusState = "idle" | "running" | "finished" | "error" | "aborted";
 export interface LogBatchMsg {
     type: "log_batch";
     content?: string;
+    /** Absolute backend log offset; present on poll replies. */
+    new_offset?: number;
     status?: StatusState;
 }
 
 export interface RunFinishedMsg {
     type: "run_finished";
     logs?: string;
+    /** Absolute backend log offset matching `logs`. */
+    log_offset?: number;
     status?: StatusState;
 }
 
@@ -25,55 +25,101 @@ Example:
     ```
 """
 
-# Core abstractions
-from .core import (
-    Pipeline,
-    PipelineConfig,
-    action,
-    ParamsBase,
-    typed_params,
-    PipelineError,
-    ValidationError,
-    DependencyError,
-    ExecutionError,
-    ConfigurationError,
-)
-
-# Widget
-from .widget import PipelineWidget, create_launcher
-
-# Layout DSL
-from .layout import (
-    Layout,
-    Field,
-    UIElement,
-    Validator,
-    Validators,
-    Components,
-)
-
-# Runtime utilities
-from .runtime import (
-    run_command,
-    check_colab,
-    check_environment,
-    check_tool,
-    setup_environment,
-    PixiEnvironment,
-    mount_google_drive,
-)
-
-# Execution utilities
-from .execution import (
-    PipelineLogger,
-    Progress,
-    Step,
-    ResultBundle,
-    ResultFile,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Core abstractions
+    from .core import (
+        Pipeline,
+        PipelineConfig,
+        action,
+        ParamsBase,
+        typed_params,
+        PipelineError,
+        ValidationError,
+        DependencyError,
+        ExecutionError,
+        ConfigurationError,
+    )
+
+    # Widget
+    from .widget import PipelineWidget, create_launcher
+
+    # Layout DSL
+    from .layout import (
+        Layout,
+        Field,
+        UIElement,
+        Validator,
+        Validators,
+        Components,
+    )
+
+    # Runtime utilities
+    from .runtime import (
+        run_command,
+        check_colab,
+        check_environment,
+        check_tool,
+        check_tools,
+        setup_environment,
+        PixiEnvironment,
+        mount_google_drive,
+    )
+
+    # Execution utilities
+    from .execution import (
+        PipelineLogger,
+        Progress,
+        Step,
+        ResultBundle,
+        ResultFile,
+    )
 
 __version__ = "0.3.0"
 
+# Submodule providing each public name; resolved lazily via PEP 562 so
+# `import pydgey` stays cheap until a symbol is actually used.
+_LAZY_IMPORTS = {
+    # Core
+    "Pipeline": ".core",
+    "PipelineConfig": ".core",
+    "action": ".core",
+    "ParamsBase": ".core",
+    "typed_params": ".core",
+    "PipelineError": ".core",
+    "ValidationError": ".core",
+    "DependencyError": ".core",
+    "ExecutionError": ".core",
+    "ConfigurationError": ".core",
+    # Widget
+    "PipelineWidget": ".widget",
+    "create_launcher": ".widget",
+    # Layout
+    "Layout": ".layout",
+    "Field": ".layout",
+    "UIElement": ".layout",
+    "Validator": ".layout",
+    "Validators": ".layout",
+    "Components": ".layout",
+    # Runtime
+    "run_command": ".runtime",
+    "check_colab": ".runtime",
+    "check_environment": ".runtime",
+    "check_tool": ".runtime",
+    "check_tools": ".runtime",
+    "setup_environment": ".runtime",
+    "PixiEnvironment": ".runtime",
+    "mount_google_drive": ".runtime",
+    # Execution
+    "PipelineLogger": ".execution",
+    "Progress": ".execution",
+    "Step": ".execution",
+    "ResultBundle": ".execution",
+    "ResultFile": ".execution",
+}
+
 __all__ = [
     # Core
     "Pipeline",
@@ -96,6 +142,7 @@ __all__ = [
     "check_colab",
     "check_environment",
     "check_tool",
+    "check_tools",
     "setup_environment",
     "PixiEnvironment",
     "mount_google_drive",
@@ -112,3 +159,19 @@ __all__ = [
     "ExecutionError",
     "ConfigurationError",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve public names on first access (PEP 562 lazy imports)."""
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    globals()[name] = value  # Cache so future lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
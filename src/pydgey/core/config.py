@@ -4,12 +4,13 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PipelineConfig:
     """Configuration metadata for the pipeline.
 
     This configuration controls the header and meta-information displayed
-    in the [PipelineWidget](../api/widget.md).
+    in the [PipelineWidget](../api/widget.md). Instances are immutable and
+    can safely be shared across threads.
 
     Attributes:
         name (str): Internal identifier for the pipeline. Defaults to "Pipeline".
@@ -6,6 +6,8 @@ from typing import Any, Dict, List, Optional
 class PipelineError(Exception):
     """Base exception for pipeline errors."""
 
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message)
         self.message = message
@@ -15,6 +17,8 @@ class PipelineError(Exception):
 class ValidationError(PipelineError):
     """Raised when parameter validation fails."""
 
+    __slots__ = ("field", "errors")
+
     def __init__(
         self,
         message: str,
@@ -52,6 +56,8 @@ class ValidationError(PipelineError):
 class DependencyError(PipelineError):
     """Raised when a required dependency is missing."""
 
+    __slots__ = ("tool", "install_hint")
+
     def __init__(
         self,
         message: str,
@@ -73,6 +79,8 @@ class DependencyError(PipelineError):
 class ExecutionError(PipelineError):
     """Raised when pipeline execution fails."""
 
+    __slots__ = ("step", "exit_code", "stderr")
+
     def __init__(
         self,
         message: str,
@@ -100,7 +108,7 @@ class ExecutionError(PipelineError):
 class ConfigurationError(PipelineError):
     """Raised when pipeline configuration is invalid."""
 
-    pass
+    __slots__ = ()
 
 
 class FileNotFoundPipelineError(PipelineError):
@@ -110,6 +118,8 @@ class FileNotFoundPipelineError(PipelineError):
         Named to avoid shadowing the builtin FileNotFoundError.
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, message: str, path: str):
         """Initialize file not found error.
 
@@ -128,6 +138,8 @@ class TimeoutPipelineError(PipelineError):
         Named to avoid shadowing the builtin TimeoutError.
     """
 
+    __slots__ = ("timeout_seconds",)
+
     def __init__(self, message: str, timeout_seconds: float):
         """Initialize timeout error.
 
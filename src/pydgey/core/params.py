@@ -3,11 +3,26 @@
 Provides type-safe access to pipeline parameters using dataclasses.
 """
 
-from dataclasses import field, fields
+import functools
+import typing
+from dataclasses import fields
 from typing import Any, Dict, Type, TypeVar, get_type_hints
 
 T = TypeVar("T")
 
+# String values treated as True when coercing to bool
+_TRUTHY: frozenset = frozenset({"true", "1", "yes"})
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_type_hints(cls: type) -> Dict[str, Any]:
+    """Resolve type hints once per class.
+
+    get_type_hints is surprisingly expensive and parameter classes are
+    immutable at runtime, so the result can be cached on the class object.
+    """
+    return get_type_hints(cls)
+
 
 def typed_params(cls: Type[T]) -> Type[T]:
     """Decorator to create a typed parameter configuration class.
@@ -42,6 +57,18 @@ def typed_params(cls: Type[T]) -> Type[T]:
         The decorated class with added `from_dict` and `to_dict` methods.
     """
 
+    # Resolve fields and type hints once at decoration time; from_dict and
+    # to_dict then iterate a plain tuple instead of re-walking the dataclass
+    # machinery on every call. Coercers are specialized per field so the hot
+    # loop is a single function call with no type introspection.
+    hints = _cached_type_hints(cls)
+    cls._typed_params_fields = tuple(
+        (f.name, hints.get(f.name, f.type)) for f in fields(cls)
+    )
+    cls._typed_coercers = tuple(
+        (name, _make_coercer(ftype)) for name, ftype in cls._typed_params_fields
+    )
+
     @classmethod
     def from_dict(cls_: Type[T], data: Dict[str, Any]) -> T:
         """Create an instance from a dictionary of raw values.
@@ -54,33 +81,85 @@ def typed_params(cls: Type[T]) -> Type[T]:
         """
         kwargs = {}
 
-        for f in fields(cls_):
-            name = f.name
+        # Missing keys are simply omitted; cls_(**kwargs) applies the
+        # dataclass defaults.
+        for name, coerce in cls_._typed_coercers:
             if name in data:
-                value = data[name]
-                kwargs[name] = _coerce_type(value, f.type)
-            elif f.default is not field:
-                # Use the default from the dataclass
-                pass  # Will be set by dataclass
-            elif f.default_factory is not field:
-                pass  # Will be set by dataclass
+                kwargs[name] = coerce(data[name])
 
         return cls_(**kwargs)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the instance back to a dictionary.
-
-        Returns:
-            Dict[str, Any]: Dictionary of field names and values.
-        """
-        return {f.name: getattr(self, f.name) for f in fields(self)}
-
     cls.from_dict = from_dict
-    cls.to_dict = to_dict
+    cls.to_dict = _generate_to_dict(cls)
 
     return cls
 
 
+def _generate_to_dict(cls: type) -> Any:
+    """Generate a specialized to_dict for a dataclass.
+
+    The returned function inlines the attribute loads directly — no
+    fields() walk, no comprehension — the same trick dataclasses uses to
+    build __init__.
+    """
+    names = [f.name for f in fields(cls)]
+    body = ", ".join(f"{name!r}: self.{name}" for name in names)
+    src = f"def to_dict(self):\n    return {{{body}}}\n"
+    ns: Dict[str, Any] = {}
+    exec(src, ns)
+    to_dict = ns["to_dict"]
+    to_dict.__doc__ = (
+        "Convert the instance back to a dictionary.\n\n"
+        "        Returns:\n"
+        "            Dict[str, Any]: Dictionary of field names and values.\n"
+        "        "
+    )
+    return to_dict
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_target(target_type: Any) -> Any:
+    """Unwrap Optional[X] (and single-type unions with None) to X.
+
+    Cached because the same handful of field types recurs across every
+    coercion; repeat resolution is a dict lookup.
+    """
+    if typing.get_origin(target_type) is typing.Union:
+        args = [a for a in typing.get_args(target_type) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return target_type
+
+
+def _make_coercer(target_type: Any) -> Any:
+    """Build a coercion function specialized for one target type.
+
+    The Optional unwrap and type dispatch happen once here, at decoration
+    time, so the returned closure does no introspection per value.
+    """
+    target_type = _resolve_target(target_type)
+
+    if target_type is int:
+        return lambda v: v if v is None else (int(v) if v != "" else 0)
+    if target_type is float:
+        return lambda v: v if v is None else (float(v) if v != "" else 0.0)
+    if target_type is bool:
+
+        def _coerce_bool(v: Any) -> Any:
+            if v is None or isinstance(v, bool):
+                return v
+            if isinstance(v, str):
+                return v.lower() in _TRUTHY
+            return bool(v)
+
+        return _coerce_bool
+    if target_type is str:
+        return lambda v: v if v is None else str(v)
+
+    # No specialization available; fall back to the generic path.
+    return lambda v, _t=target_type: _coerce_type(v, _t)
+
+
 def _coerce_type(value: Any, target_type: Any) -> Any:
     """Coerce a value to the target type.
 
@@ -90,24 +169,14 @@ def _coerce_type(value: Any, target_type: Any) -> Any:
     if value is None:
         return None
 
-    # Get the actual type (handle Optional, etc.)
-    origin = getattr(target_type, "__origin__", None)
-    if origin is type(None):
-        return None
+    # Unwrap Optional[X] to X (cached per type)
+    target_type = _resolve_target(target_type)
 
-    # Handle Optional types
-    if origin is type(None) or (
-        hasattr(target_type, "__args__") and type(None) in target_type.__args__
-    ):
-        # It's Optional[X], get X
-        args = getattr(target_type, "__args__", ())
-        for arg in args:
-            if arg is not type(None):
-                target_type = arg
-                break
-
-    # Already correct type
-    if isinstance(value, target_type) if isinstance(target_type, type) else False:
+    # Already correct type: identity check first (single pointer compare),
+    # isinstance only on mismatch to catch subclasses.
+    if type(value) is target_type:
+        return value
+    if isinstance(target_type, type) and isinstance(value, target_type):
         return value
 
     # Type coercion
@@ -119,7 +188,7 @@ def _coerce_type(value: Any, target_type: Any) -> Any:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
+            return value.lower() in _TRUTHY
         return bool(value)
     elif target_type is str:
         return str(value) if value is not None else ""
@@ -156,7 +225,7 @@ class ParamsBase:
         kwargs = {}
 
         # Get type hints for the class
-        hints = get_type_hints(cls)
+        hints = _cached_type_hints(cls)
 
         for f in fields(cls):
             name = f.name
@@ -173,7 +242,10 @@ class ParamsBase:
         Returns:
             Dict[str, Any]: Encoded dictionary.
         """
-        return {f.name: getattr(self, f.name) for f in fields(self)}
+        # First call per class swaps in a generated, field-inlined to_dict
+        cls = type(self)
+        cls.to_dict = _generate_to_dict(cls)
+        return cls.to_dict(self)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a parameter value with optional default.
@@ -1,16 +1,30 @@
 """Abstract base class for pipelines."""
 
+import subprocess
+import threading
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
 from pathlib import Path
 
 from .config import PipelineConfig
 
 if TYPE_CHECKING:
-    from ..logging import PipelineLogger
-    from ..results import ResultBundle
+    from ..execution.logging import PipelineLogger
+    from ..execution.results import ResultBundle
+
+# run_command from runtime.commands, bound on first use; importing it at
+# module top would drag the runtime package into every core import.
+_run_command = None
 
-import subprocess
+
+def _get_run_command():
+    global _run_command
+    if _run_command is None:
+        from ..runtime.commands import run_command
+
+        _run_command = run_command
+    return _run_command
 
 
 class Pipeline(ABC):
@@ -42,6 +56,18 @@ class Pipeline(ABC):
         ```
     """
 
+    # Maps action name -> method name; rebuilt per subclass in
+    # __init_subclass__ so handle_action is a single dict lookup.
+    _action_registry: Dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        registry = dict(cls._action_registry)  # Inherit parent actions
+        for attr_name, attr in cls.__dict__.items():
+            if callable(attr) and getattr(attr, "_is_action", False):
+                registry[attr._action_name] = attr_name
+        cls._action_registry = registry
+
     def __init__(self, config: Optional[PipelineConfig] = None):
         """Initialize the pipeline.
 
@@ -50,6 +76,7 @@ class Pipeline(ABC):
         """
         self.config = config or PipelineConfig()
         self._stop_requested = False
+        self._stop_event = threading.Event()
         self._active_process: "subprocess.Popen | None" = None
 
     def define_layout(self) -> Optional[Any]:
@@ -82,6 +109,7 @@ class Pipeline(ABC):
         Subclasses can override for additional cleanup.
         """
         self._stop_requested = True
+        self._stop_event.set()
         if self._active_process and self._active_process.poll() is None:
             self._active_process.terminate()
             try:
@@ -136,9 +164,7 @@ class Pipeline(ABC):
                 return False
             ```
         """
-        from ..commands import run_command as _run_command
-
-        return _run_command(
+        return _get_run_command()(
             command=command,
             logger=logger,
             stop_check=lambda: self._stop_requested,
@@ -181,19 +207,35 @@ class Pipeline(ABC):
         Returns:
             True if action succeeded, False otherwise.
         """
-        # Find method decorated with @action(action_name)
-        for attr_name in dir(self):
-            try:
-                attr = getattr(self, attr_name)
-                if callable(attr) and getattr(attr, "_is_action", False):
-                    if getattr(attr, "_action_name") == action_name:
-                        return attr(logger)
-            except Exception:
-                continue
+        # Registry built in __init_subclass__ from @action(name) methods
+        method_name = type(self)._action_registry.get(action_name)
+        if method_name is not None:
+            return getattr(self, method_name)(logger)
+
+        # Fallback for handlers attached after class creation: walk the MRO
+        # class dicts directly so properties and other descriptors are never
+        # materialized during the scan.
+        for klass in type(self).__mro__:
+            for attr_name, attr in klass.__dict__.items():
+                if (
+                    getattr(attr, "_is_action", False)
+                    and getattr(attr, "_action_name", None) == action_name
+                ):
+                    return attr(self, logger)
 
         logger.warning(f"No handler for action: {action_name}")
         return False
 
+    @cached_property
+    def cached_schema(self) -> Dict[str, Any]:
+        """The schema from get_schema, computed once per pipeline instance.
+
+        Widgets can be recreated across notebook re-renders, but the
+        layout tree and config for a given pipeline object don't change,
+        so the schema is built once and reused.
+        """
+        return self.get_schema()
+
     def get_schema(self) -> Dict[str, Any]:
         """Get the full schema to send to the widget.
 
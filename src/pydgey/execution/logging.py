@@ -1,21 +1,41 @@
 import sys
 from typing import Callable, Optional
-from rich.console import Console
-from rich.theme import Theme
-
-# Define professional theme
-PIPELINE_THEME = Theme(
-    {
-        "info": "dim white",
-        "success": "bold green",
-        "warning": "bold yellow",
-        "error": "bold red",
-        "stage": "bold white reverse",
-        "step": "bold white",
-        "command": "dim white",
-        "highlight": "bold magenta",
-    }
-)
+
+# Professional theme styles; the rich Theme itself is built lazily so
+# importing this module (e.g. for Progress/ResultBundle only) doesn't pay
+# for pulling in rich.
+_THEME_STYLES = {
+    "info": "dim white",
+    "success": "bold green",
+    "warning": "bold yellow",
+    "error": "bold red",
+    "stage": "bold white reverse",
+    "step": "bold white",
+    "command": "dim white",
+    "highlight": "bold magenta",
+}
+
+_THEME = None  # rich.theme.Theme, created on first logger construction
+Text = None  # rich.text.Text, bound alongside _THEME
+
+
+def _ensure_rich():
+    """Import rich and build the shared theme on first use."""
+    global _THEME, Text
+    if _THEME is None:
+        from rich.text import Text as _Text
+        from rich.theme import Theme
+
+        Text = _Text
+        _THEME = Theme(_THEME_STYLES)
+
+
+def __getattr__(name: str):
+    """Keep the old public PIPELINE_THEME constant importable."""
+    if name == "PIPELINE_THEME":
+        _ensure_rich()
+        return _THEME
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class PipelineLogger:
@@ -28,35 +48,82 @@ class PipelineLogger:
     `write_callback`.
     """
 
-    def __init__(self, write_callback: Optional[Callable[[str], None]] = None):
+    def __init__(
+        self,
+        write_callback: Optional[Callable[[str], None]] = None,
+        ansi: bool = True,
+    ):
         """Initialize the logger.
 
         Args:
             write_callback: Function to call for writing log output. If None,
                 writes to sys.stdout.
+            ansi: Emit ANSI color escapes. Disable when the destination
+                renders plain text; Rich then skips escape-sequence
+                building entirely.
         """
         self.callback = write_callback
-        # Initialize rich console with the theme and forcing ANSI for widget compatibility
-        self.console = Console(
-            theme=PIPELINE_THEME,
-            force_terminal=True,
-            force_interactive=False,
-            color_system="standard",  # Standard 8-color for best compatibility
-            width=100,
-            file=self,  # We act as the file to capture output
-        )
+        # Pending write segments; drained once per logical line so each
+        # console.print costs one callback invocation, not one per styled
+        # span. Matters when the callback is a widget comm message.
+        self._buf: list = []
+        self._buf_len = 0
+        _ensure_rich()
+        from rich.console import Console
+
+        if ansi:
+            # Force ANSI output for widget compatibility
+            self.console = Console(
+                theme=_THEME,
+                force_terminal=True,
+                force_interactive=False,
+                color_system="standard",  # Standard 8-color for best compatibility
+                width=100,
+                file=self,  # We act as the file to capture output
+            )
+        else:
+            self.console = Console(
+                theme=_THEME,
+                color_system=None,
+                no_color=True,
+                highlight=False,
+                width=100,
+                file=self,
+            )
+        # Pre-rendered prefixes so the hot logging methods can assemble a
+        # Text object directly instead of re-parsing markup on every call.
+        self._step_prefix = Text("❯ ")
+        self._info_prefix = Text("ℹ ")
+        self._success_prefix = Text("✓ ")
+        self._warning_prefix = Text("⚠ ")
+        self._error_prefix = Text("✘ ")
+        self._command_prefix = Text("  ")
 
     def write(self, text: str):
-        """Standard write method so Rich can use this class as a file."""
+        """Standard write method so Rich can use this class as a file.
+
+        Segments are buffered until a newline arrives, then emitted as one
+        callback invocation per logical line; newline-free floods (e.g.
+        progress writes via redirected stdout) are capped at 4 KiB so the
+        buffer can't grow without bound between lines.
+        """
+        self._buf.append(text)
+        self._buf_len += len(text)
+        if "\n" in text or self._buf_len > 4096:
+            self.flush()
+
+    def flush(self):
+        """Drain any buffered output to the destination."""
+        if not self._buf:
+            return
+        text = "".join(self._buf)
+        self._buf.clear()
+        self._buf_len = 0
         if self.callback:
             self.callback(text)
         else:
             sys.stdout.write(text)
 
-    def flush(self):
-        """Flush method for file-like interface."""
-        pass
-
     def stage(self, name: str):
         """Log a major pipeline stage header.
 
@@ -71,7 +138,7 @@ class PipelineLogger:
             logger.stage("Data Preprocessing")
         """
         self.console.print()
-        self.console.print(f" {name.upper()} ", style="stage")
+        self.console.print(Text(f" {name.upper()} ", style="stage"))
         self.console.print()
 
     def step(self, text: str):
@@ -86,7 +153,7 @@ class PipelineLogger:
 
             logger.step("Aligning sequences with standard parameters")
         """
-        self.console.print(f"❯ [step]{text}[/step]")
+        self.console.print(Text.assemble(self._step_prefix, (text, "step")))
 
     def info(self, text: str):
         """Log an informational message.
@@ -100,7 +167,7 @@ class PipelineLogger:
 
             logger.info("Found 14 matching sequences")
         """
-        self.console.print(f"ℹ [info]{text}[/info]")
+        self.console.print(Text.assemble(self._info_prefix, (text, "info")))
 
     def success(self, text: str):
         """Log a success message.
@@ -114,7 +181,7 @@ class PipelineLogger:
 
             logger.success("Alignment completed successfully")
         """
-        self.console.print(f"✓ [success]{text}[/success]")
+        self.console.print(Text.assemble(self._success_prefix, (text, "success")))
 
     def warning(self, text: str):
         """Log a warning message.
@@ -128,7 +195,7 @@ class PipelineLogger:
 
             logger.warning("Low quality scores detected in 3 samples")
         """
-        self.console.print(f"⚠ [warning]{text}[/warning]")
+        self.console.print(Text.assemble(self._warning_prefix, (text, "warning")))
 
     def error(self, text: str):
         """Log an error message.
@@ -142,7 +209,7 @@ class PipelineLogger:
 
             logger.error("Process failed with exit code 1")
         """
-        self.console.print(f"✘ [error]{text}[/error]")
+        self.console.print(Text.assemble(self._error_prefix, (text, "error")))
 
     def command(self, cmd: str):
         """Log a command being executed.
@@ -156,7 +223,7 @@ class PipelineLogger:
 
             logger.command("bowtie2 -x index -U reads.fq")
         """
-        self.console.print(f"  [command]$ {cmd}[/command]")
+        self.console.print(Text.assemble(self._command_prefix, (f"$ {cmd}", "command")))
 
     def plain(self, text: str):
         """Log plain text without any symbols or special prefixes.
@@ -1,44 +1,60 @@
 """Progress tracking for pipeline execution."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 import time
 
 
-@dataclass
+_MINUTE_NS = 60_000_000_000
+_HOUR_NS = 3_600_000_000_000
+
+
+def _format_duration_ns(d_ns: Optional[int]) -> str:
+    """Format a nanosecond duration as a short human-readable string.
+
+    Branches on integer thresholds so division only happens for the final
+    format.
+    """
+    if d_ns is None:
+        return ""
+    if d_ns < _MINUTE_NS:
+        return f"{d_ns / 1e9:.1f}s"
+    elif d_ns < _HOUR_NS:
+        return f"{d_ns / _MINUTE_NS:.1f}m"
+    else:
+        return f"{d_ns / _HOUR_NS:.1f}h"
+
+
+@dataclass(slots=True)
 class Step:
     """A single step in a pipeline execution."""
 
     name: str
     status: str = "pending"  # pending, running, completed, failed, skipped
     message: str = ""
-    started_at: Optional[float] = None
-    completed_at: Optional[float] = None
+    started_at_ns: Optional[int] = None
+    completed_at_ns: Optional[int] = None
+
+    def _duration_ns_at(self, now_ns: int) -> Optional[int]:
+        """Duration in nanoseconds, using a caller-supplied clock reading."""
+        if self.started_at_ns and self.completed_at_ns:
+            return self.completed_at_ns - self.started_at_ns
+        elif self.started_at_ns:
+            return now_ns - self.started_at_ns
+        return None
 
     @property
     def duration(self) -> Optional[float]:
         """Get step duration in seconds."""
-        if self.started_at and self.completed_at:
-            return self.completed_at - self.started_at
-        elif self.started_at:
-            return time.time() - self.started_at
-        return None
+        d_ns = self._duration_ns_at(time.monotonic_ns())
+        return None if d_ns is None else d_ns / 1e9
 
     @property
     def duration_human(self) -> str:
         """Get human-readable duration."""
-        d = self.duration
-        if d is None:
-            return ""
-        if d < 60:
-            return f"{d:.1f}s"
-        elif d < 3600:
-            return f"{d / 60:.1f}m"
-        else:
-            return f"{d / 3600:.1f}h"
+        return _format_duration_ns(self._duration_ns_at(time.monotonic_ns()))
 
 
-@dataclass
 class Progress:
     """Track progress through a multi-step pipeline.
 
@@ -60,9 +76,7 @@ class Progress:
             pass
     """
 
-    steps: List[Step] = field(default_factory=list)
-    on_update: Optional[Callable[["Progress"], None]] = None
-    _current_step: Optional[Step] = None
+    __slots__ = ("steps", "on_update", "_current_step", "_index")
 
     def __init__(
         self,
@@ -78,10 +92,14 @@ class Progress:
         self.steps = []
         self.on_update = on_update
         self._current_step = None
+        # Name -> Step index so lookups stay O(1) regardless of step count
+        self._index: Dict[str, Step] = {}
 
         if step_names:
             for name in step_names:
-                self.steps.append(Step(name=name))
+                step = Step(name=name)
+                self.steps.append(step)
+                self._index[name] = step
 
     def add_step(self, name: str) -> Step:
         """Add a new step.
@@ -94,6 +112,7 @@ class Progress:
         """
         step = Step(name=name)
         self.steps.append(step)
+        self._index[name] = step
         self._notify()
         return step
 
@@ -126,7 +145,7 @@ class Progress:
         if step:
             step.status = "running"
             step.message = message
-            step.started_at = time.time()
+            step.started_at_ns = time.monotonic_ns()
             self._current_step = step
             self._notify()
         return step
@@ -145,7 +164,7 @@ class Progress:
         if step:
             step.status = "completed"
             step.message = message
-            step.completed_at = time.time()
+            step.completed_at_ns = time.monotonic_ns()
             if self._current_step == step:
                 self._current_step = None
             self._notify()
@@ -165,7 +184,7 @@ class Progress:
         if step:
             step.status = "failed"
             step.message = message
-            step.completed_at = time.time()
+            step.completed_at_ns = time.monotonic_ns()
             if self._current_step == step:
                 self._current_step = None
             self._notify()
@@ -222,13 +241,16 @@ class Progress:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
+        # Read the clock once for the whole snapshot rather than once per
+        # running step.
+        now_ns = time.monotonic_ns()
         return {
             "steps": [
                 {
                     "name": s.name,
                     "status": s.status,
                     "message": s.message,
-                    "duration": s.duration_human,
+                    "duration": _format_duration_ns(s._duration_ns_at(now_ns)),
                 }
                 for s in self.steps
             ],
@@ -240,10 +262,7 @@ class Progress:
 
     def _get_step(self, name: str) -> Optional[Step]:
         """Find a step by name."""
-        for step in self.steps:
-            if step.name == name:
-                return step
-        return None
+        return self._index.get(name)
 
     def _notify(self) -> None:
         """Call the update callback if set."""
@@ -260,7 +279,7 @@ class StepContext:
 
     def __enter__(self) -> Step:
         self.step.status = "running"
-        self.step.started_at = time.time()
+        self.step.started_at_ns = time.monotonic_ns()
         self.progress._current_step = self.step
         self.progress._notify()
         return self.step
@@ -272,7 +291,7 @@ class StepContext:
         else:
             self.step.status = "completed"
 
-        self.step.completed_at = time.time()
+        self.step.completed_at_ns = time.monotonic_ns()
         if self.progress._current_step == self.step:
             self.progress._current_step = None
         self.progress._notify()
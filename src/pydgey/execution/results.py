@@ -1,8 +1,126 @@
 """Result file handling utilities."""
 
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+import fnmatch
+import io
+import os
+import queue
+import shutil
+import threading
 import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Already-compressed content; deflating it again wastes CPU for no gain.
+_STORED_SUFFIXES = frozenset(
+    {
+        ".gz",
+        ".bgz",
+        ".bam",
+        ".cram",
+        ".zip",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".mp4",
+        ".parquet",
+        ".bz2",
+        ".xz",
+        ".zst",
+    }
+)
+
+# Files above this size are streamed through the archive in chunks
+# instead of being read into memory by ZipFile.write.
+_STREAM_THRESHOLD = 64 * 1024
+_COPY_BUFFER = 1 << 20
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _format_size(n: int) -> str:
+    """Format a byte count as a short human-readable string.
+
+    Picks the magnitude from the bit length instead of looping div-by-1024.
+    """
+    if n < 1024:
+        return f"{n:.1f} B"
+    mag = min((n.bit_length() - 1) // 10, 4)
+    return f"{n / (1 << (mag * 10)):.1f} {_SIZE_UNITS[mag]}"
+
+
+class _ChunkCollector(io.RawIOBase):
+    """Non-seekable sink collecting whatever ZipFile writes.
+
+    Reporting itself unseekable makes ZipFile emit data-descriptor
+    records, so the archive can be produced strictly front to back and
+    handed out chunk by chunk.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> List[bytes]:
+        """Hand over the collected chunks and reset."""
+        chunks = self._chunks
+        self._chunks = []
+        return chunks
+
+
+def _compress_file(path: Path, level: int) -> Tuple[bytes, int, int]:
+    """Deflate a file into a raw deflate stream (worker-thread side).
+
+    Reads and compresses in 64 KiB blocks, collecting the output as a
+    list of small chunks joined once at the end — peak memory is the
+    compressed size plus one block, never twice the file size. zlib
+    releases the GIL while compressing, so several of these can run
+    concurrently.
+
+    Returns:
+        Tuple of (compressed bytes, CRC32, uncompressed size).
+    """
+    comp = zlib.compressobj(level, zlib.DEFLATED, -15)
+    crc = 0
+    size = 0
+    parts: List[bytes] = []
+    with open(path, "rb") as src:
+        while chunk := src.read(1 << 16):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            out = comp.compress(chunk)
+            if out:
+                parts.append(out)
+    parts.append(comp.flush())
+    return b"".join(parts), crc, size
+
+
+def _write_precompressed(
+    zf: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes
+) -> None:
+    """Append an entry whose payload was deflated outside the ZipFile.
+
+    Mirrors what ZipFile.writestr does minus the compression: write the
+    local header and payload, then register the entry in the directory
+    structures. info must have CRC, compress_size and file_size set.
+    """
+    zip64 = (
+        info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+    )
+    info.header_offset = zf.fp.tell()
+    zf.fp.write(info.FileHeader(zip64))
+    zf.fp.write(data)
+    zf.filelist.append(info)
+    zf.NameToInfo[info.filename] = info
+    zf.start_dir = zf.fp.tell()
 
 
 class ResultFile:
@@ -16,6 +134,7 @@ class ResultFile:
         path: Union[str, Path],
         description: str = "",
         category: str = "output",
+        stat: Optional[os.stat_result] = None,
     ):
         """Initialize a result file.
 
@@ -23,36 +142,67 @@ class ResultFile:
             path: Path to the file.
             description: Human-readable description.
             category: Category for grouping (output, log, intermediate).
+            stat: Known stat result for the file, if the caller already
+                has one (e.g. from a directory scan); seeds the cache so
+                the file is never stat'd again.
         """
-        self.path = Path(path)
+        # Keep the raw string; Path construction is deferred until a
+        # caller actually needs Path semantics (most only need the string).
+        self._path_str = os.fspath(path)
+        self._path: Optional[Path] = None
         self.description = description
         self.category = category
+        # Lazily populated os.stat_result (None = missing file); one
+        # syscall serves exists/size_bytes/to_dict instead of one each.
+        self._stat = stat
+        self._stat_fresh = stat is not None
+        self._size_human: Optional[str] = None
+
+    @property
+    def path(self) -> Path:
+        """Path to the file (built lazily from the stored string)."""
+        if self._path is None:
+            self._path = Path(self._path_str)
+        return self._path
+
+    def _stat_result(self) -> Optional[os.stat_result]:
+        """Stat the file once and cache the result."""
+        if not self._stat_fresh:
+            try:
+                self._stat = os.stat(self._path_str)
+            except FileNotFoundError:
+                self._stat = None
+            self._stat_fresh = True
+        return self._stat
+
+    def invalidate(self) -> None:
+        """Drop the cached stat after the file has been modified."""
+        self._stat_fresh = False
+        self._size_human = None
 
     @property
     def exists(self) -> bool:
         """Check if the file exists."""
-        return self.path.exists()
+        return self._stat_result() is not None
 
     @property
     def size_bytes(self) -> int:
         """Get file size in bytes."""
-        return self.path.stat().st_size if self.exists else 0
+        st = self._stat_result()
+        return st.st_size if st is not None else 0
 
     @property
     def size_human(self) -> str:
         """Get human-readable file size."""
-        size = self.size_bytes
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        if self._size_human is None:
+            self._size_human = _format_size(self.size_bytes)
+        return self._size_human
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
-            "path": str(self.path),
-            "name": self.path.name,
+            "path": self._path_str,
+            "name": os.path.basename(self._path_str),
             "description": self.description,
             "category": self.category,
             "exists": self.exists,
@@ -81,9 +231,23 @@ class ResultBundle:
         """
         self.name = name
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
-        self.files: List[ResultFile] = []
+        self._base_dir_str = str(self.base_dir)
+        # Keyed by os.path.realpath so the same file added twice (directly
+        # and via add_directory, or through a symlink) yields one entry
+        # instead of a duplicate zip member. Insertion order is preserved.
+        self._files_by_path: Dict[str, ResultFile] = {}
         self.directories: List[Path] = []
 
+    @property
+    def files(self) -> List[ResultFile]:
+        """Result files in insertion order, deduplicated by real path."""
+        return list(self._files_by_path.values())
+
+    def _add_result_file(self, result_file: ResultFile) -> None:
+        key = os.path.realpath(result_file._path_str)
+        if key not in self._files_by_path:
+            self._files_by_path[key] = result_file
+
     def add_file(
         self,
         path: Union[str, Path],
@@ -100,8 +264,11 @@ class ResultBundle:
         Returns:
             Self for chaining.
         """
-        full_path = self.base_dir / path if not Path(path).is_absolute() else Path(path)
-        self.files.append(ResultFile(full_path, description, category))
+        # Pure string handling; building Path objects here is measurable
+        # when files are added in a loop.
+        raw = os.fspath(path)
+        full_path = raw if os.path.isabs(raw) else os.path.join(self._base_dir_str, raw)
+        self._add_result_file(ResultFile(full_path, description, category))
         return self
 
     def add_directory(
@@ -121,23 +288,133 @@ class ResultBundle:
             Self for chaining.
         """
         dir_path = self.base_dir / path if not Path(path).is_absolute() else Path(path)
-        if dir_path.exists() and dir_path.is_dir():
-            self.directories.append(dir_path)
-            for file_path in dir_path.glob(pattern):
-                if file_path.is_file():
-                    self.files.append(ResultFile(file_path, description, "output"))
+        if "/" in pattern or "**" in pattern:
+            # Multi-level patterns still go through pathlib
+            if dir_path.exists() and dir_path.is_dir():
+                self.directories.append(dir_path)
+                for file_path in dir_path.glob(pattern):
+                    if file_path.is_file():
+                        self._add_result_file(
+                            ResultFile(file_path, description, "output")
+                        )
+            return self
+
+        # Single-level patterns use scandir: one syscall lists the directory
+        # and DirEntry caches the file type and stat, so no per-file stat
+        # calls here or in the later zip/summary passes.
+        try:
+            entries = os.scandir(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return self
+        self.directories.append(dir_path)
+        with entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if pattern != "*" and not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                if entry.is_file():
+                    try:
+                        entry_stat = entry.stat()
+                    except FileNotFoundError:
+                        entry_stat = None
+                    self._add_result_file(
+                        ResultFile(entry.path, description, "output", stat=entry_stat)
+                    )
+        return self
+
+    def add_directory_recursive(
+        self,
+        path: Union[str, Path],
+        description: str = "",
+        pattern: str = "*",
+    ) -> "ResultBundle":
+        """Add all files under a directory tree to the bundle.
+
+        The tree is walked with os.scandir on a producer thread while this
+        thread builds the ResultFile entries, so directory listing overlaps
+        with path canonicalization instead of running serially. Each file's
+        DirEntry stat is carried over, so later zip/summary passes don't
+        stat again.
+
+        Args:
+            path: Path to the directory tree.
+            description: Description for files.
+            pattern: Glob pattern matched against file names at every level.
+
+        Returns:
+            Self for chaining.
+        """
+        dir_path = self.base_dir / path if not Path(path).is_absolute() else Path(path)
+        if not dir_path.is_dir():
+            return self
+        self.directories.append(dir_path)
+
+        entry_queue: "queue.Queue[Optional[Tuple[str, Optional[os.stat_result]]]]" = (
+            queue.Queue(maxsize=256)
+        )
+
+        def _walk() -> None:
+            # Explicit stack instead of recursion; symlinked directories are
+            # skipped so a cycle can't loop the walk forever.
+            stack = [str(dir_path)]
+            try:
+                while stack:
+                    try:
+                        entries = os.scandir(stack.pop())
+                    except OSError:
+                        continue
+                    with entries:
+                        for entry in sorted(entries, key=lambda e: e.name):
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif entry.is_file() and (
+                                pattern == "*" or fnmatch.fnmatch(entry.name, pattern)
+                            ):
+                                try:
+                                    entry_stat = entry.stat()
+                                except FileNotFoundError:
+                                    entry_stat = None
+                                entry_queue.put((entry.path, entry_stat))
+            finally:
+                entry_queue.put(None)
+
+        producer = threading.Thread(target=_walk, daemon=True)
+        producer.start()
+        while True:
+            item = entry_queue.get()
+            if item is None:
+                break
+            entry_path, entry_stat = item
+            self._add_result_file(
+                ResultFile(entry_path, description, "output", stat=entry_stat)
+            )
+        producer.join()
         return self
 
     def create_zip(
         self,
         output_path: Optional[Path] = None,
         include_empty: bool = False,
+        compression: Optional[int] = None,
+        compresslevel: int = 1,
+        stored_suffixes: frozenset = _STORED_SUFFIXES,
+        workers: Optional[int] = None,
     ) -> Optional[Path]:
         """Create a zip file containing all results.
 
         Args:
             output_path: Path for the zip file. Defaults to {name}_results.zip.
             include_empty: If False, skip files that don't exist.
+            compression: Force a zipfile compression constant for every
+                entry. By default, already-compressed files (.gz, .png,
+                etc.) are stored as-is and everything else is deflated.
+            compresslevel: zlib level for deflated entries. Defaults to 1:
+                several times faster than the zlib default with only a
+                minor ratio loss on typical logs/outputs.
+            stored_suffixes: File suffixes treated as already compressed
+                and stored without deflating.
+            workers: Threads for deflating large files in parallel
+                (zlib releases the GIL). Defaults to the CPU count;
+                pass 1 to compress serially.
 
         Returns:
             Path to the created zip file, or None if no files.
@@ -150,48 +427,226 @@ class ResultBundle:
         if not files_to_zip:
             return None
 
-        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for result_file in files_to_zip:
-                if result_file.exists:
-                    # Use relative path in zip
-                    try:
-                        arc_name = result_file.path.relative_to(self.base_dir)
-                    except ValueError:
-                        arc_name = result_file.path.name
-                    zf.write(result_file.path, arc_name)
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        # A 1 MiB output buffer batches zipfile's many small header/chunk
+        # writes into few large ones; the default is only a few KiB.
+        with (
+            open(output_path, "wb", buffering=_COPY_BUFFER) as out,
+            zipfile.ZipFile(
+                out,
+                "w",
+                zipfile.ZIP_DEFLATED,
+                allowZip64=True,
+                compresslevel=compresslevel,
+            ) as zf,
+        ):
+            if workers > 1:
+                self._write_members_parallel(
+                    zf,
+                    files_to_zip,
+                    compression,
+                    compresslevel,
+                    stored_suffixes,
+                    workers,
+                )
+            else:
+                for result_file in files_to_zip:
+                    if result_file.exists:
+                        self._write_member(
+                            zf,
+                            result_file,
+                            self._arc_name(result_file),
+                            self._compress_type(
+                                result_file, compression, stored_suffixes
+                            ),
+                        )
 
         return output_path
 
-    def get_summary(self) -> Dict[str, Any]:
+    def create_zip_stream(
+        self,
+        compression: Optional[int] = None,
+        compresslevel: int = 1,
+        stored_suffixes: frozenset = _STORED_SUFFIXES,
+    ) -> Iterator[bytes]:
+        """Generate the zip archive as a stream of byte chunks.
+
+        Constant-memory alternative to create_zip for callers that upload
+        or serve the archive instead of keeping it on disk: only one
+        source chunk is in flight at a time and nothing is written
+        locally.
+
+        Args:
+            compression: Force a zipfile compression constant for every
+                entry (same semantics as create_zip).
+            compresslevel: zlib level for deflated entries.
+            stored_suffixes: File suffixes stored without deflating.
+
+        Yields:
+            Chunks of the archive, in order.
+        """
+        collector = _ChunkCollector()
+        with zipfile.ZipFile(
+            collector,
+            "w",
+            zipfile.ZIP_DEFLATED,
+            allowZip64=True,
+            compresslevel=compresslevel,
+        ) as zf:
+            for result_file in self.files:
+                if not result_file.exists:
+                    continue
+                info = zipfile.ZipInfo.from_file(
+                    result_file.path, self._arc_name(result_file)
+                )
+                info.compress_type = self._compress_type(
+                    result_file, compression, stored_suffixes
+                )
+                with (
+                    open(result_file.path, "rb", buffering=_COPY_BUFFER) as src,
+                    zf.open(info, "w", force_zip64=True) as dst,
+                ):
+                    while chunk := src.read(65536):
+                        dst.write(chunk)
+                        yield from collector.drain()
+                yield from collector.drain()
+        # Central directory written on ZipFile close
+        yield from collector.drain()
+
+    def _arc_name(self, result_file: ResultFile) -> str:
+        """Archive name for a file: relative to base_dir where possible."""
+        try:
+            return str(result_file.path.relative_to(self.base_dir))
+        except ValueError:
+            return result_file.path.name
+
+    @staticmethod
+    def _compress_type(
+        result_file: ResultFile,
+        compression: Optional[int],
+        stored_suffixes: frozenset,
+    ) -> int:
+        """Pick the zip compression constant for one file."""
+        if compression is not None:
+            return compression
+        # Last suffix decides; covers double suffixes like .fastq.gz as well.
+        return (
+            zipfile.ZIP_STORED
+            if result_file.path.suffix.lower() in stored_suffixes
+            else zipfile.ZIP_DEFLATED
+        )
+
+    @staticmethod
+    def _write_member(
+        zf: zipfile.ZipFile,
+        result_file: ResultFile,
+        arc_name: str,
+        compress_type: int,
+    ) -> None:
+        """Write one file into the archive on the calling thread."""
+        if result_file.size_bytes > _STREAM_THRESHOLD:
+            # Stream large files through the archive in chunks rather
+            # than buffering them whole.
+            info = zipfile.ZipInfo.from_file(result_file.path, arc_name)
+            info.compress_type = compress_type
+            with (
+                open(result_file.path, "rb", buffering=_COPY_BUFFER) as src,
+                zf.open(info, "w", force_zip64=True) as dst,
+            ):
+                shutil.copyfileobj(src, dst, _COPY_BUFFER)
+        else:
+            zf.write(result_file.path, arc_name, compress_type=compress_type)
+
+    def _write_members_parallel(
+        self,
+        zf: zipfile.ZipFile,
+        files_to_zip: List[ResultFile],
+        compression: Optional[int],
+        compresslevel: int,
+        stored_suffixes: frozenset,
+        workers: int,
+    ) -> None:
+        """Write members with large deflated files compressed by a pool.
+
+        Workers produce raw deflate streams concurrently; this thread
+        writes entries in submission order, keeping at most a bounded
+        number of compressed files in memory. Stored and small entries
+        are written inline.
+        """
+        max_inflight = workers * 2
+
+        def _drain_one(pending: deque) -> None:
+            result_file, arc_name, compress_type, future = pending.popleft()
+            if future is None:
+                self._write_member(zf, result_file, arc_name, compress_type)
+                return
+            data, crc, size = future.result()
+            info = zipfile.ZipInfo.from_file(result_file.path, arc_name)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.CRC = crc
+            info.compress_size = len(data)
+            info.file_size = size
+            _write_precompressed(zf, info, data)
+
+        pending: deque = deque()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for result_file in files_to_zip:
+                if not result_file.exists:
+                    continue
+                arc_name = self._arc_name(result_file)
+                compress_type = self._compress_type(
+                    result_file, compression, stored_suffixes
+                )
+                future = None
+                if (
+                    compress_type == zipfile.ZIP_DEFLATED
+                    and result_file.size_bytes > _STREAM_THRESHOLD
+                ):
+                    future = pool.submit(
+                        _compress_file, result_file.path, compresslevel
+                    )
+                while len(pending) >= max_inflight:
+                    _drain_one(pending)
+                pending.append((result_file, arc_name, compress_type, future))
+            while pending:
+                _drain_one(pending)
+
+    def get_summary(self, include_files: bool = True) -> Dict[str, Any]:
         """Get a summary of the bundle.
 
+        Args:
+            include_files: Include the per-file dict list. Pass False for
+                pollers that only read counts and total size; skipping
+                the per-file dicts makes the summary much cheaper.
+
         Returns:
             Dictionary with file counts and total size.
         """
-        existing = [f for f in self.files if f.exists]
-        total_size = sum(f.size_bytes for f in existing)
+        # Single pass over the files; each ResultFile stats at most once.
+        total_size = 0
+        file_count = 0
+        categories: Dict[str, int] = {}
+        file_dicts = []
+        for f in self.files:
+            if f.exists:
+                total_size += f.size_bytes
+                file_count += 1
+                categories[f.category] = categories.get(f.category, 0) + 1
+                if include_files:
+                    file_dicts.append(f.to_dict())
 
-        return {
+        summary: Dict[str, Any] = {
             "name": self.name,
-            "file_count": len(existing),
-            "total_size": self._format_size(total_size),
-            "categories": self._count_by_category(),
-            "files": [f.to_dict() for f in existing],
+            "file_count": file_count,
+            "total_size": _format_size(total_size),
+            "categories": categories,
         }
+        if include_files:
+            summary["files"] = file_dicts
+        return summary
 
-    def _count_by_category(self) -> Dict[str, int]:
-        """Count files by category."""
-        counts: Dict[str, int] = {}
-        for f in self.files:
-            if f.exists:
-                counts[f.category] = counts.get(f.category, 0) + 1
-        return counts
-
-    @staticmethod
-    def _format_size(size_bytes: int) -> str:
-        """Format bytes as human-readable string."""
-        for unit in ["B", "KB", "MB", "GB"]:
-            if size_bytes < 1024:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024
-        return f"{size_bytes:.1f} TB"
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """Get just the counts and total size, without per-file dicts."""
+        return self.get_summary(include_files=False)
@@ -4,6 +4,7 @@ from .elements import UIElement, Layout
 from .fields import Field
 from .validators import Validator, Validators, ValidationResult
 from .components import Components
+from .serializer import LayoutSerializer
 
 __all__ = [
     "UIElement",
@@ -13,4 +14,5 @@ __all__ = [
     "Validators",
     "ValidationResult",
     "Components",
+    "LayoutSerializer",
 ]
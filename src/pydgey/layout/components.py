@@ -4,17 +4,74 @@ This module provides factory functions that create common UI patterns
 combining multiple layout elements and fields.
 """
 
+import functools
+from dataclasses import replace
 from typing import Any, Dict, List, Optional, Tuple
 
 from .elements import Layout, UIElement
 from .fields import Field
 from .validators import Validators
 
+# Common sequence-file extensions, hoisted so repeated component builds
+# share one tuple (and hit the cached file_extension validator).
+_FASTA_EXTS: Tuple[str, ...] = (
+    ".fasta",
+    ".fa",
+    ".fna",
+    ".ffn",
+    ".faa",
+)
+_FASTQ_EXTS: Tuple[str, ...] = (".fastq", ".fq", ".fastq.gz", ".fq.gz")
+_SEQUENCE_EXTS: Tuple[str, ...] = (
+    _FASTA_EXTS
+    + (".fastq", ".fq")
+    + (".fasta.gz", ".fa.gz", ".fna.gz")
+    + (".fastq.gz", ".fq.gz")
+)
+
+
+def _freeze(value: Any) -> Any:
+    """Normalize lists/dicts to hashable tuples for memoization keys."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _memoized(factory):
+    """Memoize a pure component factory on its arguments.
+
+    UIElement trees are frozen, so callers can safely share the cached
+    instance. Arguments that can't be made hashable fall back to a plain
+    call. The distinct-argument space per factory is tiny in practice,
+    so the cache is unbounded.
+    """
+    cache: Dict[Any, Any] = {}
+
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        try:
+            key = (
+                tuple(_freeze(a) for a in args),
+                tuple(sorted((k, _freeze(v)) for k, v in kwargs.items())),
+            )
+            hash(key)
+        except TypeError:
+            return factory(*args, **kwargs)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = factory(*args, **kwargs)
+        return result
+
+    return wrapper
+
 
 class Components:
     """Factory for common UI component patterns."""
 
     @staticmethod
+    @_memoized
     def FileInput(
         name: str = "input_file",
         label: str = "Input File",
@@ -58,6 +115,7 @@ class Components:
         )
 
     @staticmethod
+    @_memoized
     def OutputConfig(
         prefix_name: str = "output_prefix",
         prefix_label: str = "Output Prefix",
@@ -84,6 +142,8 @@ class Components:
             )
             ```
         """
+        # Built in one expression so the retained list is exactly sized
+        # rather than carrying append over-allocation for the tree's life.
         children = [
             Field.Text(
                 prefix_name,
@@ -91,21 +151,23 @@ class Components:
                 default=prefix_default,
                 description="Prefix for generated output files",
             ),
-        ]
-
-        if include_directory:
-            children.append(
+        ] + (
+            [
                 Field.Text(
                     directory_name,
                     "Output Directory",
                     default=directory_default,
                     description="Directory for output files",
                 )
-            )
+            ]
+            if include_directory
+            else []
+        )
 
         return Layout.Card("Output Settings", children)
 
     @staticmethod
+    @_memoized
     def PerformanceSettings(
         cpu_name: str = "cpu",
         cpu_default: int = 4,
@@ -138,10 +200,8 @@ class Components:
                 max=cpu_max,
                 description="Number of CPU cores to use",
             ),
-        ]
-
-        if include_memory:
-            children.append(
+        ] + (
+            [
                 Field.Int(
                     memory_name,
                     "Memory (GB)",
@@ -149,11 +209,15 @@ class Components:
                     min=1,
                     description="Memory limit in gigabytes",
                 )
-            )
+            ]
+            if include_memory
+            else []
+        )
 
         return Layout.Card("Performance", children)
 
     @staticmethod
+    @_memoized
     def ThresholdSettings(
         thresholds: List[Dict[str, Any]],
         title: str = "Thresholds",
@@ -203,6 +267,7 @@ class Components:
         return Layout.Card(title, children)
 
     @staticmethod
+    @_memoized
     def AdvancedSection(
         children: List[UIElement],
         title: str = "Advanced Options",
@@ -257,12 +322,7 @@ class Components:
             ```
         """
         # Clone the field with visible_when
-        return UIElement(
-            type=field.type,
-            props=field.props,
-            children=field.children,
-            visible_when=(depends_on, operator, value),
-        )
+        return replace(field, visible_when=(depends_on, operator, value))
 
     @staticmethod
     def ToolInstallAction(
@@ -294,6 +354,7 @@ class Components:
     # ===== Bioinformatics Components =====
 
     @staticmethod
+    @_memoized
     def FastaInput(
         name: str = "fasta_file",
         label: str = "FASTA/FASTQ File",
@@ -321,20 +382,7 @@ class Components:
             ```
         """
         if accept is None:
-            accept = [
-                ".fasta",
-                ".fa",
-                ".fna",
-                ".ffn",
-                ".faa",  # FASTA variants
-                ".fastq",
-                ".fq",  # FASTQ variants
-                ".fasta.gz",
-                ".fa.gz",
-                ".fna.gz",  # Compressed FASTA
-                ".fastq.gz",
-                ".fq.gz",  # Compressed FASTQ
-            ]
+            accept = _SEQUENCE_EXTS
 
         validators = []
         if required:
@@ -351,6 +399,7 @@ class Components:
         )
 
     @staticmethod
+    @_memoized
     def PairedEndInput(
         r1_name: str = "reads_r1",
         r2_name: str = "reads_r2",
@@ -380,45 +429,41 @@ class Components:
             )
             ```
         """
-        fastq_extensions = [".fastq", ".fq", ".fastq.gz", ".fq.gz"]
-
-        children = []
-
-        if description:
-            children.append(Layout.Text(description, class_name="text-muted"))
-
-        children.extend(
-            [
-                Layout.Row(
-                    [
-                        Field.File(
-                            name=r1_name,
-                            label=r1_label,
-                            accept=fastq_extensions,
-                            description="Forward reads file",
-                            validators=[
-                                Validators.required("Forward reads required"),
-                                Validators.file_extension(fastq_extensions),
-                            ],
-                        ),
-                        Field.File(
-                            name=r2_name,
-                            label=r2_label,
-                            accept=fastq_extensions,
-                            description="Reverse reads file",
-                            validators=[
-                                Validators.required("Reverse reads required"),
-                                Validators.file_extension(fastq_extensions),
-                            ],
-                        ),
-                    ]
-                ),
-            ]
-        )
+        fastq_extensions = _FASTQ_EXTS
+
+        children = (
+            [Layout.Text(description, class_name="text-muted")] if description else []
+        ) + [
+            Layout.Row(
+                [
+                    Field.File(
+                        name=r1_name,
+                        label=r1_label,
+                        accept=fastq_extensions,
+                        description="Forward reads file",
+                        validators=[
+                            Validators.required("Forward reads required"),
+                            Validators.file_extension(fastq_extensions),
+                        ],
+                    ),
+                    Field.File(
+                        name=r2_name,
+                        label=r2_label,
+                        accept=fastq_extensions,
+                        description="Reverse reads file",
+                        validators=[
+                            Validators.required("Reverse reads required"),
+                            Validators.file_extension(fastq_extensions),
+                        ],
+                    ),
+                ]
+            ),
+        ]
 
         return Layout.Card(title, children)
 
     @staticmethod
+    @_memoized
     def InputPreview(
         file_field: str,
         preview_name: str = "input_preview",
@@ -468,6 +513,7 @@ class Components:
         )
 
     @staticmethod
+    @_memoized
     def GoogleDriveOutput(
         mount_drive_name: str = "use_drive",
         drive_path_name: str = "drive_path",
@@ -1,16 +1,28 @@
 """UI layout elements and containers."""
 
+import json
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+try:  # Optional fast path; the stdlib json fallback is always available.
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Structural nodes (page, row, tabs) rarely carry props; sharing one empty
+# dict avoids allocating one per node. to_dict never copies props, and
+# elements are immutable by convention, so sharing is safe.
+_EMPTY_PROPS: Dict[str, Any] = {}
+
+
+@dataclass(slots=True, frozen=True, eq=False)
 class UIElement:
     """Base class for all UI elements.
 
     UIElements form a tree structure that describes the layout
     of the pipeline widget interface. They are typically created using
-    factory methods in `Layout` and `Field`.
+    factory methods in `Layout` and `Field`. They are treated as
+    immutable once built, which lets `to_dict` cache its result.
 
     Attributes:
         type (str): Element type (e.g., 'page', 'section', 'row', 'card').
@@ -22,29 +34,93 @@ class UIElement:
     """
 
     type: str
-    props: Dict[str, Any] = field(default_factory=dict)
+    props: Dict[str, Any] = field(default_factory=lambda: _EMPTY_PROPS)
     children: List["UIElement"] = field(default_factory=list)
     visible_when: Optional[Tuple[str, str, Any]] = None
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization.
 
+        The result is cached per element, so re-serializing a layout
+        only rebuilds subtrees that have never been rendered.
+
         Returns:
             Dict[str, Any]: JSON-serializable dictionary representation.
         """
+        if self._cached_dict is not None:
+            return self._cached_dict
+
+        # Post-order iterative walk: children are converted before their
+        # parents without spending one Python frame per tree level.
+        order: List["UIElement"] = []
+        stack: List["UIElement"] = [self]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children)
+
+        for node in reversed(order):
+            if node._cached_dict is not None:
+                continue
+            d: Dict[str, Any] = {
+                "type": node.type,
+                "props": node.props,
+                "children": [c._cached_dict for c in node.children],
+            }
+            if node.visible_when:
+                field_name, operator, value = node.visible_when
+                d["visibleWhen"] = {
+                    "field": field_name,
+                    "operator": operator,
+                    "value": value,
+                }
+            object.__setattr__(node, "_cached_dict", d)
+
+        return self._cached_dict
+
+    def to_json(self) -> bytes:
+        """Serialize the element tree to UTF-8 JSON bytes.
+
+        With orjson installed the tree is walked entirely in C via a
+        default handler, skipping the Python-level to_dict pass; otherwise
+        this is json.dumps over to_dict.
+
+        Returns:
+            bytes: JSON document for the frontend.
+        """
+        if orjson is not None:
+            if self._cached_dict is not None:
+                return orjson.dumps(self._cached_dict)
+            # Passthrough stops orjson's native dataclass handling, which
+            # would emit raw field names instead of the frontend shape.
+            return orjson.dumps(
+                self,
+                default=_element_default,
+                option=orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        return json.dumps(self.to_dict()).encode()
+
+
+def _element_default(node: Any) -> Dict[str, Any]:
+    """orjson default hook emitting UIElement nodes as frontend dicts."""
+    if isinstance(node, UIElement):
         d: Dict[str, Any] = {
-            "type": self.type,
-            "props": self.props,
-            "children": [c.to_dict() for c in self.children],
+            "type": node.type,
+            "props": node.props,
+            "children": node.children,
         }
-        if self.visible_when:
-            field_name, operator, value = self.visible_when
+        if node.visible_when:
+            field_name, operator, value = node.visible_when
             d["visibleWhen"] = {
                 "field": field_name,
                 "operator": operator,
                 "value": value,
             }
         return d
+    raise TypeError
 
 
 class Layout:
@@ -6,6 +6,23 @@ from .elements import UIElement
 from .validators import Validator
 
 
+# Skeleton props per field type, copied per call so the "type" key never
+# has to be re-inserted and unknown types fail loudly at the lookup.
+_TEMPLATES = {
+    t: {"type": t}
+    for t in (
+        "text",
+        "int",
+        "float",
+        "switch",
+        "select",
+        "multiselect",
+        "file",
+        "textarea",
+    )
+}
+
+
 class Field:
     """Factory methods for creating form field components in the layout.
 
@@ -30,13 +47,23 @@ class Field:
         validators: Optional[List[Validator]] = None,
         **kwargs: Any,
     ) -> UIElement:
-        """Internal helper to create field elements."""
-        props: dict[str, Any] = {
-            "name": name,
-            "label": label,
-            "type": type_name,
-            **kwargs,
-        }
+        """Internal helper to create field elements.
+
+        Builds the props dict once, skipping None-valued settings so the
+        schema sent to the frontend only carries what the caller set.
+        """
+        props: dict[str, Any] = _TEMPLATES[type_name].copy()
+        props["name"] = name
+        props["label"] = label
+        for key, value in kwargs.items():
+            if value is None:
+                continue
+            # Empty helper strings match the frontend's own defaults, so
+            # omitting them shrinks the schema without changing the render.
+            # "default" is always kept: _extract_defaults reads it.
+            if value == "" and key != "default":
+                continue
+            props[key] = value
 
         if validators:
             props["validators"] = [v.to_dict() for v in validators]
@@ -0,0 +1,65 @@
+"""Opt-in layout serialization with a shared validator table."""
+
+import json
+from typing import Any, Dict, List
+
+from .elements import UIElement
+
+
+class LayoutSerializer:
+    """Serialize a layout tree with validators deduplicated into a table.
+
+    Layouts reuse the same handful of validators across many fields; the
+    plain `UIElement.to_dict` form repeats each validator dict per field.
+    This serializer hoists every distinct validator dict into one shared
+    table and rewrites each field to carry integer `validatorRefs`
+    instead, shrinking the payload roughly in proportion to how widely
+    validators are shared.
+
+    The output shape differs from `to_dict`, so this is opt-in: the
+    frontend must resolve `validatorRefs` against the `validators` table.
+
+    Example:
+        ```python
+        serialized = LayoutSerializer().serialize(layout)
+        serialized["validators"]  # shared table
+        serialized["layout"]      # tree with validatorRefs per field
+        ```
+    """
+
+    def serialize(self, root: UIElement) -> Dict[str, Any]:
+        """Serialize a layout tree to a table-referenced form.
+
+        Args:
+            root: Root element of the layout tree.
+
+        Returns:
+            Dict with "layout" (the tree, fields carrying validatorRefs)
+            and "validators" (the shared table the refs index into).
+        """
+        table: List[Dict[str, Any]] = []
+        # Keyed on canonical JSON so equal validators collapse even when
+        # each field built its own instance via the Validators factories.
+        index_by_key: Dict[str, int] = {}
+
+        def convert(node: UIElement) -> Dict[str, Any]:
+            d = dict(node.to_dict())
+            props = d["props"]
+            validators = props.get("validators")
+            if validators:
+                props = dict(props)
+                refs = []
+                for validator_dict in validators:
+                    key = json.dumps(validator_dict, sort_keys=True)
+                    ref = index_by_key.get(key)
+                    if ref is None:
+                        ref = index_by_key[key] = len(table)
+                        table.append(validator_dict)
+                    refs.append(ref)
+                del props["validators"]
+                props["validatorRefs"] = refs
+                d["props"] = props
+            d["children"] = [convert(c) for c in node.children]
+            return d
+
+        return {"layout": convert(root), "validators": table}
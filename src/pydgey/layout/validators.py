@@ -1,7 +1,8 @@
 """Field validators for layout elements."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 
 @dataclass
@@ -17,10 +18,14 @@ class ValidationResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class Validator:
     """Validator definition that can be serialized to frontend.
 
+    Validators are immutable once built, which lets shared instances
+    (e.g. the memoized file-extension validators below) cache their
+    serialized form instead of emitting a fresh dict per field.
+
     Attributes:
         type: Validator type (required, minLength, maxLength, range, pattern, email, fileExtension).
         params: Parameters specific to the validator type.
@@ -30,14 +35,21 @@ class Validator:
     type: str
     params: Dict[str, Any]
     message: str
+    _cached_dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "type": self.type,
-            "params": self.params,
-            "message": self.message,
-        }
+        d = self._cached_dict
+        if d is None:
+            d = {
+                "type": self.type,
+                "params": self.params,
+                "message": self.message,
+            }
+            object.__setattr__(self, "_cached_dict", d)
+        return d
 
 
 class Validators:
@@ -120,20 +132,16 @@ class Validators:
 
     @staticmethod
     def file_extension(
-        extensions: List[str],
+        extensions: Union[List[str], Tuple[str, ...]],
         message: str = "",
     ) -> Validator:
         """Validate file has an allowed extension.
 
         Args:
-            extensions: List of allowed extensions (e.g., [".txt", ".csv"]).
+            extensions: Allowed extensions (e.g., [".txt", ".csv"]).
             message: Error message if validation fails.
         """
-        return Validator(
-            "fileExtension",
-            {"extensions": extensions},
-            message or f"Allowed extensions: {', '.join(extensions)}",
-        )
+        return _cached_file_extension(tuple(extensions), message)
 
     @staticmethod
     def min_value(value: float, message: str = "") -> Validator:
@@ -162,3 +170,17 @@ class Validators:
             {"value": value},
             message or f"Must be at most {value}",
         )
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_file_extension(extensions: Tuple[str, ...], message: str) -> Validator:
+    """Build (or reuse) a file-extension validator for one extension set.
+
+    Components recreate the same extension lists on every call; caching on
+    the tuple makes repeat builds share one Validator instance.
+    """
+    return Validator(
+        "fileExtension",
+        {"extensions": list(extensions)},
+        message or f"Allowed extensions: {', '.join(extensions)}",
+    )
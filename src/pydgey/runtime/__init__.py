@@ -12,8 +12,10 @@ from .environment import (
     check_colab,
     check_environment,
     check_tool,
+    check_tools,
     find_lockfile,
     is_pixi_installed,
+    prepare_command,
     setup_environment,
     wrap_command_for_pixi,
 )
@@ -25,8 +27,10 @@ __all__ = [
     "check_colab",
     "check_environment",
     "check_tool",
+    "check_tools",
     "find_lockfile",
     "is_pixi_installed",
+    "prepare_command",
     "setup_environment",
     "wrap_command_for_pixi",
     "keep_alive_thread",
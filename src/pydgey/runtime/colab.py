@@ -1,3 +1,4 @@
+import functools
 import sys
 import os
 import subprocess
@@ -8,11 +9,14 @@ from typing import Optional
 from ..execution import PipelineLogger
 
 
+@functools.cache
 def check_colab() -> bool:
     """Check if the code is running inside Google Colab.
 
     This utility inspects `sys.modules` to determine if the environment
-    is Google Colab.
+    is Google Colab. The answer can't change within a process, so it is
+    computed once; tests monkey-patching `sys.modules` must call
+    `check_colab.cache_clear()`.
 
     Returns:
         bool: True if running in Colab, False otherwise.
@@ -55,28 +59,34 @@ def setup_colab() -> None:
     logger.success("Setup complete")
 
 
-def keep_alive_thread(interval_seconds: int = 30) -> threading.Thread:
+def keep_alive_thread(
+    interval_seconds: int = 30,
+) -> tuple[threading.Thread, threading.Event]:
     """Start a background thread to prevent Colab usage timeouts.
 
     Google Colab runtimes may disconnect if there is no interactivity for a
     certain period. This helper starts a daemon thread that wakes up periodically,
     helping to keep the session active during long-running pipelines.
 
+    The thread sleeps on the returned event rather than a bare
+    `time.sleep`, so setting the event shuts it down promptly instead of
+    leaking a heartbeat thread past the end of the run.
+
     Args:
         interval_seconds: Time in seconds between heartbeats.
 
     Returns:
-        threading.Thread: The background thread instance.
+        tuple: The background thread and the event that stops it.
     """
-    import time
+    stop_event = threading.Event()
 
     def _heartbeat() -> None:
-        while True:
-            time.sleep(interval_seconds)
+        while not stop_event.wait(interval_seconds):
+            pass
 
     t = threading.Thread(target=_heartbeat, daemon=True)
     t.start()
-    return t
+    return t, stop_event
 
 
 def mount_google_drive(
@@ -1,13 +1,91 @@
 """Command execution utilities for pipeline steps."""
 
 import os
+import queue
+import selectors
 import subprocess
 import shlex
+import threading
 import codecs
 from pathlib import Path
 from typing import Callable, List, Optional, Union
 
 from ..execution.logging import PipelineLogger
+from .environment import clear_environment_cache, find_lockfile, prepare_command
+
+
+def clear_pixi_cache() -> None:
+    """Forget memoized pixi probes (call after installing an environment)."""
+    clear_environment_cache()
+
+
+def _iter_output(process, stop_check):
+    """Yield stdout chunks as they arrive, sleeping in the kernel between.
+
+    The selector blocks with a 0.1 s timeout so stop_check still runs at
+    10 Hz without spinning on empty reads; reads pull up to 64 KiB per
+    syscall. Yields None once if stop_check fires. Where selectors can't
+    watch pipes (e.g. Windows), a reader thread feeding a queue provides
+    the same blocking behaviour.
+    """
+    stdout = process.stdout
+    try:
+        selector = selectors.DefaultSelector()
+        selector.register(stdout, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        yield from _iter_output_threaded(stdout, process, stop_check)
+        return
+
+    fd = stdout.fileno()
+    with selector:
+        while True:
+            if stop_check and stop_check():
+                yield None
+                return
+            try:
+                ready = selector.select(timeout=0.1)
+            except OSError:
+                # Windows: register() accepts a pipe but select() only
+                # handles sockets and raises here. Nothing has been
+                # consumed yet, so hand the stream to the reader thread.
+                yield from _iter_output_threaded(stdout, process, stop_check)
+                return
+            if not ready:
+                if process.poll() is not None:
+                    return
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:  # EOF
+                return
+            yield chunk
+
+
+def _iter_output_threaded(stdout, process, stop_check):
+    """Fallback chunk iterator using a blocking reader thread."""
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+    def _reader() -> None:
+        try:
+            while True:
+                chunk = stdout.read(65536)
+                if not chunk:
+                    break
+                chunks.put(chunk)
+        finally:
+            chunks.put(None)
+
+    threading.Thread(target=_reader, daemon=True).start()
+    while True:
+        if stop_check and stop_check():
+            yield None
+            return
+        try:
+            chunk = chunks.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if chunk is None:
+            return
+        yield chunk
 
 
 def run_command(
@@ -37,17 +115,15 @@ def run_command(
         >>> run_command(["grep", "-r", "TODO", "."], logger)
         0
     """
-    # Apply pixi wrapper if requested and available
-    if use_pixi and isinstance(command, str):
-        from .environment import wrap_command_for_pixi
-
-        command = wrap_command_for_pixi(command)
-    elif use_pixi and isinstance(command, list):
-        from .environment import find_lockfile, get_pixi_env_bin
-
+    # Run inside the pixi environment if one applies: the cached
+    # activation env execs the target binary directly; only when the
+    # activation can't be fetched does prepare_command fall back to a
+    # `pixi run --` wrapper process.
+    pixi_env = None
+    if use_pixi:
         lockfile = find_lockfile()
-        if lockfile and get_pixi_env_bin(lockfile):
-            command = ["pixi", "run", "--"] + command
+        if lockfile is not None:
+            command, pixi_env = prepare_command(command, lockfile)
 
     if isinstance(command, list):
         # Convert list to string for display, but use list for execution
@@ -62,7 +138,7 @@ def run_command(
     logger.command(cmd_str)
 
     # Environment setup for unbuffered output
-    env = os.environ.copy()
+    env = pixi_env if pixi_env is not None else os.environ.copy()
     env["PYTHONUNBUFFERED"] = "1"
 
     try:
@@ -72,37 +148,52 @@ def run_command(
             stderr=subprocess.STDOUT,
             shell=shell_mode,
             text=False,  # Read bytes to handle any encoding issues gracefully
-            bufsize=0,  # Unbuffered
+            bufsize=-1,  # Block-buffered parent side; PYTHONUNBUFFERED keeps the child live
             env=env,
             cwd=cwd,
         )
 
+        # Best effort: widen the pipe to 1 MiB (F_SETPIPE_SZ, Linux only)
+        # so bursty output doesn't stall the child on a full 64 KiB pipe.
+        try:
+            import fcntl
+
+            fcntl.fcntl(process.stdout.fileno(), fcntl.F_SETPIPE_SZ, 1 << 20)
+        except (ImportError, AttributeError, OSError):
+            pass
+
         if on_process_start:
             on_process_start(process)
 
         decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 
-        while True:
-            # Check for stop request
-            if stop_check and stop_check():
+        # Buffer until newline boundaries so each logger call gets whole
+        # lines: chunk-sized dispatch split ANSI escapes mid-sequence and
+        # cost one formatter/IO round trip per 64 KiB read.
+        pending = ""
+        for chunk in _iter_output(process, stop_check):
+            if chunk is None:
                 process.terminate()
                 logger.warning("Terminated by user.")
                 return -1
-
-            # Non-blocking read (or small chunk read)
-            chunk = process.stdout.read(1024)
-            if not chunk:
-                if process.poll() is not None:
-                    break
-                continue
-
-            decoded = decoder.decode(chunk, final=False)
-            if decoded:
-                logger.plain(
-                    decoded.rstrip()
-                )  # rstrip to avoid double newlines from logger
-
-        return process.poll()
+            # Pure-ASCII chunks skip the incremental UTF-8 state machine;
+            # the guard on decoder state keeps split multi-byte sequences
+            # on the slow path so they still reassemble correctly.
+            if chunk.isascii() and not decoder.getstate()[0]:
+                pending += chunk.decode("ascii")
+            else:
+                pending += decoder.decode(chunk, final=False)
+            if "\n" in pending:
+                lines = pending.split("\n")
+                pending = lines.pop()
+                for line in lines:
+                    logger.plain(line.rstrip())
+
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            logger.plain(pending.rstrip())
+
+        return process.wait()
 
     except FileNotFoundError:
         logger.error(
@@ -19,15 +19,27 @@ Example:
     ```
 """
 
+import asyncio
+import codecs
+import functools
+import json
 import os
+import selectors
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
 from ..execution.logging import PipelineLogger
 
+# Whether this process is a Colab runtime cannot change mid-session, so
+# it is decided once at import.
+_IS_COLAB = "google.colab" in sys.modules
+
 
 @dataclass
 class PixiEnvironment:
@@ -38,6 +50,9 @@ class PixiEnvironment:
         env_bin_path: Path to the environment's bin directory.
         is_ready: True if the environment is fully set up.
         pixi_installed: True if the `pixi` command is available.
+        env_activation: Environment variables from `pixi shell-hook`,
+            usable as `subprocess.Popen(env=...)` to run tools without a
+            `pixi run` supervisor process per command.
 
     Example:
         ```python
@@ -51,6 +66,7 @@ class PixiEnvironment:
     env_bin_path: Optional[Path] = None
     is_ready: bool = False
     pixi_installed: bool = False
+    env_activation: Optional[Dict[str, str]] = None
 
 
 def check_colab() -> bool:
@@ -65,7 +81,7 @@ def check_colab() -> bool:
             print("Running in Google Colab")
         ```
     """
-    return "google.colab" in sys.modules
+    return _IS_COLAB
 
 
 def find_lockfile(
@@ -91,8 +107,13 @@ def find_lockfile(
     """
     if start_dir is None:
         start_dir = Path.cwd()
+    return _find_lockfile_cached(Path(start_dir).resolve(), max_depth)
+
 
-    current = start_dir.resolve()
+@functools.lru_cache(maxsize=32)
+def _find_lockfile_cached(start_dir: Path, max_depth: int) -> Optional[Path]:
+    """Cached lockfile walk; each probe is a stat syscall per level."""
+    current = start_dir
 
     for _ in range(max_depth + 1):
         lockfile = current / "pixi.lock"
@@ -107,9 +128,17 @@ def find_lockfile(
     return None
 
 
+find_lockfile.cache_clear = _find_lockfile_cached.cache_clear  # type: ignore[attr-defined]
+
+
 def is_pixi_installed() -> bool:
     """Check if Pixi is installed and accessible.
 
+    A PATH scan rather than a subprocess probe: this runs on every
+    environment check, and fork+exec with a 5 s timeout is three orders
+    of magnitude slower than the directory stats `shutil.which` does.
+    Use `get_pixi_version` when the version string is actually needed.
+
     Returns:
         True if `pixi` command is available.
 
@@ -121,13 +150,32 @@ def is_pixi_installed() -> bool:
             print("Please install Pixi: https://pixi.sh")
         ```
     """
-    try:
-        result = subprocess.run(
-            ["pixi", "--version"], capture_output=True, text=True, timeout=5
-        )
-        return result.returncode == 0
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        return False
+    return shutil.which("pixi") is not None
+
+
+_pixi_version: Optional[str] = None
+_pixi_version_lock = threading.Lock()
+
+
+def get_pixi_version() -> Optional[str]:
+    """Get the installed pixi version string, probing once per process.
+
+    Returns:
+        Version string (e.g., "pixi 0.39.0"), or None if unavailable.
+    """
+    global _pixi_version
+    with _pixi_version_lock:
+        if _pixi_version is None:
+            try:
+                result = subprocess.run(
+                    ["pixi", "--version"], capture_output=True, text=True, timeout=5
+                )
+            except (FileNotFoundError, subprocess.TimeoutExpired):
+                return None
+            if result.returncode != 0:
+                return None
+            _pixi_version = result.stdout.strip()
+        return _pixi_version
 
 
 def check_tool(command: str) -> Tuple[bool, Optional[str]]:
@@ -151,8 +199,6 @@ def check_tool(command: str) -> Tuple[bool, Optional[str]]:
             print("BLAST not installed")
         ```
     """
-    import shutil
-
     path = shutil.which(command)
     if not path:
         return False, None
@@ -167,9 +213,39 @@ def check_tool(command: str) -> Tuple[bool, Optional[str]]:
         return True, None
 
 
+def check_tools(commands: List[str]) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """Check several command-line tools concurrently.
+
+    Each check_tool call blocks on a subprocess with a 5 s timeout, so
+    pre-flighting a tool list serially costs the sum of the probes; the
+    thread pool overlaps them so it costs roughly the slowest one.
+
+    Args:
+        commands: Commands to check (e.g., ["hmmsearch", "blastn"]).
+
+    Returns:
+        Dict mapping each command to its (found, version) tuple.
+
+    Example:
+        ```python
+        results = check_tools(["hmmsearch", "blastn", "mafft"])
+        missing = [tool for tool, (found, _) in results.items() if not found]
+        ```
+    """
+    if not commands:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(32, len(commands))) as executor:
+        versions = executor.map(check_tool, commands)
+        return dict(zip(commands, versions))
+
+
+@functools.lru_cache(maxsize=32)
 def get_pixi_env_bin(lockfile_path: Path) -> Optional[Path]:
     """Get the path to the Pixi environment's bin directory.
 
+    Cached per lockfile; `clear_environment_cache` resets it after an
+    install changes the answer.
+
     Args:
         lockfile_path: Path to the pixi.lock file.
 
@@ -190,6 +266,89 @@ def get_pixi_env_bin(lockfile_path: Path) -> Optional[Path]:
     return env_bin if env_bin.exists() else None
 
 
+@functools.lru_cache(maxsize=8)
+def _shell_hook_env(manifest_dir: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    """Fetch the pixi activation variables for one project, memoized.
+
+    `pixi shell-hook` spawns a pixi process, so the result is cached per
+    manifest directory; it only changes when the environment is
+    reinstalled, at which point the cache is cleared.
+    """
+    try:
+        result = subprocess.run(
+            ["pixi", "shell-hook", "--json", "--manifest-path", manifest_dir],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        data = json.loads(result.stdout)
+    except ValueError:
+        return None
+    env_vars = data.get("environment_variables", data)
+    if not isinstance(env_vars, dict):
+        return None
+    return tuple((str(k), str(v)) for k, v in env_vars.items())
+
+
+def prepare_command(
+    command: Union[str, List[str]],
+    lockfile_path: Optional[Path] = None,
+) -> Tuple[Union[str, List[str]], Optional[Dict[str, str]]]:
+    """Prepare a command to run inside the Pixi environment.
+
+    Preferred over `wrap_command_for_pixi`: instead of paying for a
+    `pixi run` supervisor process per invocation, the project's
+    activation variables (from a cached `pixi shell-hook`) are overlaid
+    on os.environ and returned for `subprocess.Popen(env=...)`, so the
+    target binary is exec'd directly.
+
+    Args:
+        command: The command to prepare.
+        lockfile_path: Path to pixi.lock (to find project root).
+
+    Returns:
+        Tuple of (command, env). env is None when no environment applies;
+        if the activation can't be fetched, command falls back to the
+        `pixi run --` wrapper with env None.
+    """
+    if lockfile_path is None:
+        lockfile_path = find_lockfile()
+    if lockfile_path is None or get_pixi_env_bin(lockfile_path) is None:
+        return command, None
+
+    activation = _shell_hook_env(str(lockfile_path.parent))
+    if activation is None:
+        if isinstance(command, str):
+            return f"pixi run -- {command}", None
+        return ["pixi", "run", "--"] + list(command), None
+
+    env = dict(os.environ)
+    env.update(activation)
+    return command, env
+
+
+# Last check_environment result per lockfile path (None = auto-detected);
+# invalidated alongside the probe caches when an install changes state.
+_env_cache: Dict[Optional[Path], PixiEnvironment] = {}
+
+
+def clear_environment_cache() -> None:
+    """Reset all memoized environment probes.
+
+    Called after pixi or its environment is installed mid-session, and by
+    tests that rearrange the filesystem.
+    """
+    _find_lockfile_cached.cache_clear()
+    get_pixi_env_bin.cache_clear()
+    _shell_hook_env.cache_clear()
+    _env_cache.clear()
+
+
 def check_environment(lockfile_path: Optional[Path] = None) -> PixiEnvironment:
     """Assess the current Pixi environment state.
 
@@ -210,11 +369,16 @@ def check_environment(lockfile_path: Optional[Path] = None) -> PixiEnvironment:
             print("Environment ready!")
         ```
     """
+    cached = _env_cache.get(lockfile_path)
+    if cached is not None:
+        return cached
+
     env = PixiEnvironment()
 
     # Find lockfile
     env.lockfile_path = lockfile_path or find_lockfile()
     if not env.lockfile_path:
+        _env_cache[lockfile_path] = env
         return env
 
     # Check if Pixi is installed
@@ -223,10 +387,172 @@ def check_environment(lockfile_path: Optional[Path] = None) -> PixiEnvironment:
     # Check if environment is ready
     env.env_bin_path = get_pixi_env_bin(env.lockfile_path)
     env.is_ready = env.env_bin_path is not None
+    if env.is_ready:
+        activation = _shell_hook_env(str(env.lockfile_path.parent))
+        if activation is not None:
+            env.env_activation = dict(activation)
 
+    _env_cache[lockfile_path] = env
     return env
 
 
+def _stream_process(process: subprocess.Popen, logger: PipelineLogger) -> int:
+    """Forward a child's piped output to the logger as data arrives.
+
+    A selector watches stdout and stderr (whichever are piped) and reads
+    4 KiB chunks, so installer progress reaches the UI without readline
+    buffering latency and neither pipe can deadlock the other. Falls
+    back to blocking line iteration where selectors can't watch pipes.
+
+    Returns:
+        The process exit code.
+    """
+    streams = [s for s in (process.stdout, process.stderr) if s is not None]
+    try:
+        sel = selectors.DefaultSelector()
+        for stream in streams:
+            sel.register(stream, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        return _stream_fallback(process, logger)
+
+    decoders = {
+        s: codecs.getincrementaldecoder("utf-8")(errors="replace") for s in streams
+    }
+    pending = {s: "" for s in streams}
+    with sel:
+        open_streams = len(streams)
+        while open_streams:
+            try:
+                ready = sel.select()
+            except OSError:
+                # Windows: register() accepts a pipe but select() only
+                # handles sockets and raises here. Flush whatever was
+                # buffered and let the blocking fallback finish the job.
+                for tail in pending.values():
+                    if tail:
+                        logger.plain(tail.rstrip())
+                return _stream_fallback(process, logger)
+            for key, _ in ready:
+                stream = key.fileobj
+                chunk = os.read(stream.fileno(), 4096)
+                if not chunk:
+                    sel.unregister(stream)
+                    open_streams -= 1
+                    tail = pending[stream] + decoders[stream].decode(b"", final=True)
+                    if tail:
+                        logger.plain(tail.rstrip())
+                    continue
+                text = pending[stream] + decoders[stream].decode(chunk, final=False)
+                lines = text.split("\n")
+                pending[stream] = lines.pop()
+                for line in lines:
+                    logger.plain(line.rstrip())
+    return process.wait()
+
+
+def _stream_fallback(process: subprocess.Popen, logger: PipelineLogger) -> int:
+    """Blocking line iteration over the child's piped streams.
+
+    stderr drains on its own thread so a chatty stderr can't fill its
+    pipe and deadlock the child while stdout is being read.
+    """
+
+    def _drain(stream) -> None:
+        for line in stream:
+            logger.plain(line.decode("utf-8", "replace").rstrip())
+
+    stderr_thread = None
+    if process.stderr is not None:
+        stderr_thread = threading.Thread(
+            target=_drain, args=(process.stderr,), daemon=True
+        )
+        stderr_thread.start()
+    if process.stdout is not None:
+        _drain(process.stdout)
+    if stderr_thread is not None:
+        stderr_thread.join()
+    return process.wait()
+
+
+async def _stream_lines(stream: "asyncio.StreamReader", logger: PipelineLogger) -> None:
+    """Forward an asyncio stream to the logger line by line."""
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        text = line.decode("utf-8", "replace").rstrip()
+        if text:
+            logger.plain(text)
+
+
+async def _install_pixi_async(logger: PipelineLogger) -> int:
+    """Download and run the pixi installer on the event loop.
+
+    curl feeds bash through a kernel pipe created here, so no /bin/sh
+    supervisor is forked for the `curl | bash` pipeline, and the
+    installer's output streams to the logger while the download is
+    still in flight.
+
+    Returns:
+        Exit code (bash's, or curl's if only the download failed).
+    """
+    read_fd, write_fd = os.pipe()
+    curl = None
+    try:
+        # close_fds=False skips the per-spawn fd-table sweep, which is
+        # slow under Jupyter's many open sockets; the children are trusted
+        # installer binaries, not a sandbox boundary. start_new_session
+        # keeps signals aimed at them away from the kernel.
+        curl = await asyncio.create_subprocess_exec(
+            "curl",
+            "-fsSL",
+            "https://pixi.sh/install.sh",
+            stdout=write_fd,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,
+            start_new_session=True,
+        )
+    finally:
+        os.close(write_fd)
+        if curl is None:
+            # curl never spawned; nothing will read the pipe either.
+            os.close(read_fd)
+    try:
+        bash = await asyncio.create_subprocess_exec(
+            "bash",
+            stdin=read_fd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            close_fds=False,
+            start_new_session=True,
+        )
+    except BaseException:
+        # bash never spawned: reap curl rather than leaving it running
+        # against a pipe no one will read.
+        try:
+            curl.terminate()
+        except ProcessLookupError:
+            pass
+        await curl.wait()
+        raise
+    finally:
+        os.close(read_fd)
+
+    _, _, curl_err = await asyncio.gather(
+        _stream_lines(bash.stdout, logger),
+        bash.wait(),
+        curl.stderr.read(),
+    )
+    await curl.wait()
+
+    if curl.returncode != 0:
+        message = curl_err.decode("utf-8", "replace").strip()
+        if message:
+            logger.error(message)
+        return curl.returncode
+    return bash.returncode
+
+
 def install_pixi(logger: PipelineLogger) -> bool:
     """Install Pixi using the official installer.
 
@@ -250,28 +576,32 @@ def install_pixi(logger: PipelineLogger) -> bool:
     logger.info("Downloading Pixi installer...")
 
     try:
-        # Run the Pixi installer
-        process = subprocess.Popen(
-            "curl -fsSL https://pixi.sh/install.sh | bash",
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
-
-        for line in process.stdout:
-            logger.plain(line.rstrip())
-
-        process.wait()
+        # Run the installer; when called from a thread that already has a
+        # running loop (notebook main thread), hop to a worker thread so
+        # asyncio.run is legal.
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            returncode = asyncio.run(_install_pixi_async(logger))
+        else:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                returncode = pool.submit(
+                    asyncio.run, _install_pixi_async(logger)
+                ).result()
 
-        if process.returncode != 0:
-            logger.error(f"Pixi installation failed (exit code {process.returncode})")
+        if returncode != 0:
+            logger.error(f"Pixi installation failed (exit code {returncode})")
             return False
 
-        # Add Pixi to PATH for this session
+        # Add Pixi to PATH for this session; guarded so repeated installs
+        # (widget re-creation) don't grow PATH and slow every which() scan.
         pixi_bin = Path.home() / ".pixi" / "bin"
         if pixi_bin.exists():
-            os.environ["PATH"] = str(pixi_bin) + os.pathsep + os.environ["PATH"]
+            pixi_bin_str = str(pixi_bin)
+            current_path = os.environ.get("PATH", "")
+            if pixi_bin_str not in current_path.split(os.pathsep):
+                os.environ["PATH"] = pixi_bin_str + os.pathsep + current_path
+            clear_environment_cache()
             logger.success("Pixi installed successfully")
             return True
         else:
@@ -307,23 +637,23 @@ def run_pixi_install(lockfile_path: Path, logger: PipelineLogger) -> bool:
     logger.info(f"Running pixi install in {project_root}")
 
     try:
+        # See _install_pixi_async for the close_fds/start_new_session rationale.
         process = subprocess.Popen(
             ["pixi", "install"],
             cwd=project_root,
             stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+            start_new_session=True,
         )
 
-        for line in process.stdout:
-            logger.plain(line.rstrip())
-
-        process.wait()
+        returncode = _stream_process(process, logger)
 
-        if process.returncode != 0:
-            logger.error(f"pixi install failed (exit code {process.returncode})")
+        if returncode != 0:
+            logger.error(f"pixi install failed (exit code {returncode})")
             return False
 
+        clear_environment_cache()
         logger.success("Dependencies installed successfully")
         return True
 
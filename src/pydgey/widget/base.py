@@ -1,19 +1,27 @@
 """Pipeline widget for interactive execution."""
 
-import copy
+import os
+import sys
+import time
+import traceback
 from pathlib import Path
+import queue
 import threading
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
+# anywidget/traitlets must be imported eagerly: PipelineWidget subclasses
+# AnyWidget and declares traitlets at class-definition time.
 import anywidget
 import traitlets
 
 from ..core import Pipeline
-from ..execution import PipelineLogger
 from .transport import create_transport, WidgetTransport
 from ..runtime import check_colab
 from ..runtime.colab import keep_alive_thread
 
+if TYPE_CHECKING:
+    from ..execution import PipelineLogger
+
 
 class PipelineWidget(anywidget.AnyWidget):
     """Interactive notebook widget for executing pipelines.
@@ -67,8 +75,8 @@ class PipelineWidget(anywidget.AnyWidget):
         self.pipeline = pipeline
         self._last_result_path: Optional[str] = None
 
-        # Get schema from pipeline
-        schema = self.pipeline.get_schema()
+        # Get schema from pipeline (built once per pipeline instance)
+        schema = self.pipeline.cached_schema
 
         # Extract initial values from schema
         initial_values = self._extract_defaults(schema)
@@ -88,21 +96,81 @@ class PipelineWidget(anywidget.AnyWidget):
         # Create transport after super().__init__ so widget is ready
         self._transport: WidgetTransport = create_transport(self)
 
+        # Coalescing log buffer: verbose pipelines emit one comm message
+        # per 50 ms instead of one per logged line.
+        self._log_buf: list = []
+        self._log_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # One persistent worker executes runs and actions; only one can be
+        # active at a time anyway, and this avoids a thread spawn per run.
+        self._work_q: "queue.Queue[tuple]" = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+
         # Setup event handlers
         self._setup_observers()
 
-        # Start keepalive for Colab
+        # Start keepalive for Colab; keep the stop event so the thread can
+        # be shut down when the widget goes away.
+        self._keep_alive_stop: Optional[threading.Event] = None
         if check_colab():
-            keep_alive_thread()
+            _, self._keep_alive_stop = keep_alive_thread()
+
+    def _worker_loop(self) -> None:
+        """Run queued jobs on the persistent worker thread."""
+        while True:
+            fn, args = self._work_q.get()
+            try:
+                fn(*args)
+            except Exception:
+                # Job bodies report their own errors, but a failure
+                # before their try block (e.g. in an import) would
+                # otherwise vanish and leave the widget stuck on
+                # "running". Surface it without killing the worker.
+                tb = traceback.format_exc()
+                try:
+                    self._transport.send_logs(f"\n❌ Internal error:\n{tb}")
+                except Exception:
+                    print(tb, file=sys.stderr)
+            finally:
+                self._work_q.task_done()
+
+    def _buffered_send(self, text: str) -> None:
+        """Queue log output, coalescing into one send per 50 ms."""
+        with self._log_lock:
+            self._log_buf.append(text)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(0.05, self._flush_logs)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_logs(self) -> None:
+        """Send any queued log output as a single transport call."""
+        with self._log_lock:
+            chunks = self._log_buf
+            self._log_buf = []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        if chunks:
+            self._transport.send_logs("".join(chunks))
 
     def _extract_defaults(self, schema: Dict[str, Any]) -> Dict[str, Any]:
         """Extract default values from schema."""
         initial_values: Dict[str, Any] = {}
 
-        # From layout (recursive)
-        def extract_from_node(node: Any) -> None:
+        layout = schema.get("layout")
+        if not layout:
+            return initial_values
+
+        # Explicit stack instead of recursion: no Python frame per node
+        # and no depth limit on heavily nested layouts.
+        stack = [layout]
+        while stack:
+            node = stack.pop()
             if not isinstance(node, dict):
-                return
+                continue
 
             if node.get("type") == "field":
                 props = node.get("props", {})
@@ -111,12 +179,7 @@ class PipelineWidget(anywidget.AnyWidget):
                 if name and default is not None:
                     initial_values[name] = default
 
-            for child in node.get("children", []):
-                extract_from_node(child)
-
-        layout = schema.get("layout")
-        if layout:
-            extract_from_node(layout)
+            stack.extend(node.get("children", ()))
 
         return initial_values
 
@@ -153,21 +216,28 @@ class PipelineWidget(anywidget.AnyWidget):
         self._transport.clear_logs()
         self.result_file_data = ""
         self.result_file_name = ""
-        # Reset percent and set all steps to pending instantly
-        # Use deepcopy to avoid mutating during frontend iteration
-        current_progress = copy.deepcopy(self.progress)
-        current_progress["percent"] = 0
-        if "steps" in current_progress:
-            for step in current_progress["steps"]:
-                step["status"] = "pending"
-                step["duration"] = ""
-        self.progress = current_progress
+        # Reset percent and set all steps to pending instantly. Fresh dicts
+        # are built in one pass (no deepcopy reflection) and the new object
+        # identities are what make traitlets propagate the change.
+        self.progress = {
+            **self.progress,
+            "percent": 0,
+            "steps": [
+                {**step, "status": "pending", "duration": ""}
+                for step in self.progress.get("steps", [])
+            ],
+        }
 
         # Reset stop flag for new run
         self.pipeline._stop_requested = False
+        self.pipeline._stop_event.clear()
 
         def run_thread() -> None:
-            logger = PipelineLogger(self._transport.send_logs)
+            # Deferred: pulls in the execution package (and rich, on first
+            # logger construction) only when a run actually starts.
+            from ..execution import PipelineLogger
+
+            logger = PipelineLogger(self._buffered_send)
 
             try:
                 from contextlib import redirect_stderr, redirect_stdout
@@ -175,12 +245,27 @@ class PipelineWidget(anywidget.AnyWidget):
                 with redirect_stdout(logger), redirect_stderr(logger):
                     logger.stage("Starting Pipeline")
 
-                    # Connect progress tracker to widget traitlet
+                    # Connect progress tracker to widget traitlet. Each
+                    # assignment is a comm message plus a frontend
+                    # re-render, so equal snapshots are dropped and updates
+                    # are throttled to 10 Hz; the final state is emitted
+                    # unconditionally in the finally block.
                     if hasattr(self.pipeline, "progress") and self.pipeline.progress:
                         from ..execution import Progress
 
+                        last_emitted: Dict[str, Any] = {}
+                        last_time = 0.0
+
                         def update_progress(p: Progress) -> None:
-                            self.progress = p.to_dict()
+                            nonlocal last_time
+                            d = p.to_dict()
+                            now = time.monotonic()
+                            if d == last_emitted or now - last_time < 0.1:
+                                return
+                            last_emitted.clear()
+                            last_emitted.update(d)
+                            last_time = now
+                            self.progress = d
 
                         self.pipeline.progress.on_update = update_progress
 
@@ -200,8 +285,7 @@ class PipelineWidget(anywidget.AnyWidget):
                     self.status_message = "Failed"
 
             except Exception as e:
-                import traceback
-
+                self._flush_logs()
                 self._transport.send_logs(
                     f"\n✘ Critical Exception: {e}\n{traceback.format_exc()}\n"
                 )
@@ -209,12 +293,20 @@ class PipelineWidget(anywidget.AnyWidget):
                 self.status_message = f"Error: {e}"
 
             finally:
+                # Drain pending log output before the completion snapshot
+                logger.flush()
+                self._flush_logs()
+
+                # Throttling above may have swallowed the last update
+                if hasattr(self.pipeline, "progress") and self.pipeline.progress:
+                    self.progress = self.pipeline.progress.to_dict()
                 # Send completion notification
                 self._transport.send_message(
                     {
                         "type": "run_finished",
                         "status": self.status_state,
                         "logs": self._transport.get_logs(),
+                        "log_offset": self._transport.get_log_offset(),
                     }
                 )
 
@@ -222,9 +314,9 @@ class PipelineWidget(anywidget.AnyWidget):
                 if self.status_state == "finished":
                     self._prepare_result_download(logger)
 
-        threading.Thread(target=run_thread, daemon=True).start()
+        self._work_q.put((run_thread, ()))
 
-    def _prepare_result_download(self, logger: PipelineLogger) -> None:
+    def _prepare_result_download(self, logger: "PipelineLogger") -> None:
         """Prepare result file for download.
 
         Checks for results in this order:
@@ -251,15 +343,25 @@ class PipelineWidget(anywidget.AnyWidget):
                         )
                     return
 
-            # Fallback: look for legacy result zip patterns
+            # Fallback: look for legacy result zip patterns. One directory
+            # scan answers both candidate names instead of a stat apiece.
             project_name = self.params_values.get("output_name", "project")
-            zip_path = Path.cwd() / f"{project_name}_results.zip"
-
-            if not zip_path.exists():
-                prefix = self.params_values.get("output_prefix", "output")
-                zip_path = Path.cwd() / f"{prefix}_results.zip"
-
-            if zip_path.exists():
+            prefix = self.params_values.get("output_prefix", "output")
+            candidates = (f"{project_name}_results.zip", f"{prefix}_results.zip")
+            cwd = os.getcwd()
+            try:
+                with os.scandir(cwd) as entries:
+                    names = {e.name for e in entries if e.is_file()}
+            except OSError:
+                names = set()
+
+            zip_path = None
+            for candidate in candidates:
+                if candidate in names:
+                    zip_path = Path(os.path.join(cwd, candidate))
+                    break
+
+            if zip_path is not None:
                 self._last_result_path = str(zip_path)
                 result = self._transport.prepare_download(zip_path, logger)
                 if result:
@@ -283,36 +385,47 @@ class PipelineWidget(anywidget.AnyWidget):
             Signature varies by environment:
             - Standard: (content, buffers)
             - Some environments: (widget, content, buffers)
+
+        Polls fire continuously, so content is picked by position from
+        the two known shapes instead of scanning the arguments.
         """
-        # Extract content from variable argument list
-        content: Optional[Dict[str, Any]] = None
-        for arg in args:
-            if isinstance(arg, dict) and "type" in arg:
-                content = arg
-                break
-
-        if content is None:
+        if len(args) == 2:
+            content = args[0]
+        elif len(args) == 3:
+            content = args[1]
+        else:
             return
 
-        msg_type = content.get("type")
+        if not isinstance(content, dict):
+            return
 
-        if msg_type == "poll":
-            # Log polling for environments with traitlet lag
-            offset = content.get("offset", 0)
-            logs = self._transport.get_logs()
+        handler = self._MESSAGE_HANDLERS.get(content.get("type"))
+        if handler is not None:
+            handler(self, content)
 
-            msg = {
+    def _handle_poll(self, content: Dict[str, Any]) -> None:
+        """Reply to a log poll with bytes past the poller's offset."""
+        offset = content.get("offset", 0)
+        new_content, new_offset = self._transport.get_logs_since(offset)
+
+        self._transport.send_message(
+            {
                 "type": "log_batch",
-                "content": logs[offset:] if offset < len(logs) else "",
-                "new_offset": len(logs),
+                "content": new_content,
+                "new_offset": new_offset,
                 "status": self.status_state,
             }
-            self._transport.send_message(msg)
+        )
+
+    def _handle_download(self, content: Dict[str, Any]) -> None:
+        """Trigger a native download of the last result (Colab)."""
+        if self._last_result_path:
+            self._transport.trigger_download(self._last_result_path)
 
-        elif msg_type == "download":
-            # Native download request (Colab)
-            if self._last_result_path:
-                self._transport.trigger_download(self._last_result_path)
+    _MESSAGE_HANDLERS = {
+        "poll": _handle_poll,
+        "download": _handle_download,
+    }
 
     def _on_action_requested(self, change: Dict[str, Any]) -> None:
         """Handle action request."""
@@ -329,9 +442,9 @@ class PipelineWidget(anywidget.AnyWidget):
         self._transport.clear_logs()
 
         def action_thread() -> None:
-            import time
+            from ..execution import PipelineLogger
 
-            logger = PipelineLogger(self._transport.send_logs)
+            logger = PipelineLogger(self._buffered_send)
             logger.stage(f"Executing action: {action_name}")
 
             try:
@@ -341,19 +454,20 @@ class PipelineWidget(anywidget.AnyWidget):
                 logger.error(f"Action error: {e}")
                 self.status_state = "error"
             finally:
-                time.sleep(0.1)  # Brief pause for log sync
+                self._flush_logs()
 
                 self._transport.send_message(
                     {
                         "type": "run_finished",
                         "status": self.status_state,
                         "logs": self._transport.get_logs(),
+                        "log_offset": self._transport.get_log_offset(),
                         "result_file_name": self.result_file_name,
                         "result_file_data": self.result_file_data,
                     }
                 )
 
-        threading.Thread(target=action_thread, daemon=True).start()
+        self._work_q.put((action_thread, ()))
 
 
 def create_launcher(pipeline: Pipeline) -> PipelineWidget:
@@ -5,13 +5,92 @@ Abstracts environment-specific communication (Colab vs standard Jupyter).
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional, TYPE_CHECKING
-import base64
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+import bisect
+import collections
+import operator
+import os
+import sys
 import threading
+import time
+
+try:
+    # SIMD-accelerated drop-in for the stdlib encoder (pip install
+    # "pydgey[speed]"); downloads are encode-bound at the 50 MB cap.
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 if TYPE_CHECKING:
     from .widget import PipelineWidget
 
+# Snapshot of the google.colab module (or None). sys.modules.get gives
+# both the environment check and the module reference ColabTransport
+# needs, so nothing re-imports it later.
+_COLAB_MOD = sys.modules.get("google.colab")
+
+# Tail of the log history mirrored into the synced `logs` traitlet; the
+# full history stays in the transport and reaches the frontend through
+# offset-based log_batch polling, so the traitlet is only a fallback.
+MAX_SYNCED_LOG_BYTES = 262144
+
+# High-water mark for retained log history. Long runs otherwise grow
+# the history without bound; the oldest chunks are evicted past this
+# and readers see a truncation marker instead.
+MAX_LOG_BYTES = 1 << 20
+
+_TRUNCATION_MARKER = "[... log history truncated ...]\n"
+
+# Read size for streaming base64 encoding. Must be a multiple of 3 so
+# every chunk encodes without padding and the pieces concatenate cleanly.
+_B64_CHUNK_BYTES = 57 * 1024
+
+# Debounce window for coalescing log fragments into one comm message.
+_LOG_FLUSH_INTERVAL = 0.02
+
+# Per-thread scratch buffer reused across encode loops; downloads may
+# run concurrently from worker threads, so it can't be a plain global.
+_tls = threading.local()
+
+
+def _read_buffer() -> bytearray:
+    """Reusable read buffer for the current thread."""
+    buf = getattr(_tls, "read_buf", None)
+    if buf is None:
+        buf = _tls.read_buf = bytearray(_B64_CHUNK_BYTES)
+    return buf
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that fd will be read once, front to back.
+
+    Downloads are one-shot sequential reads; SEQUENTIAL enables
+    readahead and NOREUSE keeps large files from evicting useful page
+    cache. No-op where posix_fadvise is unavailable (macOS, Windows).
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL | os.POSIX_FADV_NOREUSE)
+        except OSError:
+            pass
+
+
+# MIME types for download payloads, keyed on lowercase file suffix.
+_MIME_TYPES = {
+    ".zip": "application/zip",
+    ".gz": "application/gzip",
+    ".tar": "application/x-tar",
+    ".pdf": "application/pdf",
+    ".txt": "text/plain",
+    ".csv": "text/csv",
+    ".json": "application/json",
+}
+
+# Minimum spacing between traitlet mirror refreshes. The log_batch
+# messages carry the deltas, so the synced `logs` traitlet only needs
+# to stay roughly fresh for late-joining views.
+_TRAITLET_SYNC_INTERVAL = 1.0
+
 
 class WidgetTransport(ABC):
     """Abstract base for widget-backend communication.
@@ -68,37 +147,212 @@ class StandardTransport(WidgetTransport):
     def __init__(self, widget: "PipelineWidget") -> None:
         self.widget = widget
         self._log_lock = threading.Lock()
-        self._log_history = ""
+        # History is kept as chunks with running start offsets so pollers
+        # only pay for bytes they haven't seen yet (get_logs_since) rather
+        # than re-slicing the whole history each poll.
+        self._chunks: list = []
+        self._chunk_starts: list = []
+        self._total_len = 0
+        # Fragments not yet pushed to the frontend; coalesced by a
+        # debounce timer so bursts become one comm message. A deque so
+        # producer appends are single atomic ops under the GIL and the
+        # hot path never takes _log_lock.
+        self._pending: collections.deque = collections.deque()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Memoized "".join of _chunks; invalidated whenever they change
+        # so repeated get_logs calls between appends don't re-join.
+        self._joined: Optional[str] = None
+        self._last_traitlet_push = 0.0
+        # attrgetter is a C-level lookup; getattr with a default builds
+        # an argument tuple per call and this runs on every flush.
+        self._get_status = operator.attrgetter("status_state")
+        self._truncated = False
 
     def send_logs(self, logs: str) -> None:
-        """Append logs and sync to widget traitlet."""
+        """Buffer logs and schedule a debounced flush to the frontend."""
+        self._pending.append(logs)
+        # Checked after the append: a concurrent flush clears the timer
+        # before draining, so either it picks this fragment up or we see
+        # None here and schedule a new flush. The lock only guards timer
+        # bookkeeping, never the append itself.
+        if self._flush_timer is None:
+            with self._log_lock:
+                if self._flush_timer is None:
+                    timer = threading.Timer(_LOG_FLUSH_INTERVAL, self._flush_pending)
+                    timer.daemon = True
+                    self._flush_timer = timer
+                    timer.start()
+
+    def flush(self) -> None:
+        """Push any buffered log fragments to the frontend immediately."""
+        self._flush_pending(force_mirror=True)
+
+    def _flush_pending(self, force_mirror: bool = False) -> None:
         with self._log_lock:
-            self._log_history += logs
-            self.widget.logs = self._log_history
-
+            logs = self._drain_pending_locked()
+            if not logs:
+                return
+            # The delta goes out below regardless; only the full-tail
+            # traitlet mirror is throttled, since it reships O(tail)
+            # bytes each time. Explicit flushes always refresh it.
+            now = time.monotonic()
+            if (
+                force_mirror
+                or now - self._last_traitlet_push >= _TRAITLET_SYNC_INTERVAL
+            ):
+                self._mirror_tail_locked()
+                self._last_traitlet_push = now
+            try:
+                status = self._get_status(self.widget)
+            except AttributeError:
+                status = "running"
             # Proactively push logs to frontend to ensure real-time updates
             # This bypasses traitlet sync lag and works even if polling fails
             self.widget.send(
                 {
                     "type": "log_batch",
                     "content": logs,
-                    "status": getattr(self.widget, "status_state", "running"),
+                    "status": status,
                 }
             )
 
+    def _drain_pending_locked(self) -> str:
+        """Move buffered fragments into history; caller holds _log_lock."""
+        # Timer is cleared before draining so a producer appending mid-
+        # drain either lands in this drain or schedules a fresh timer.
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        fragments = []
+        while True:
+            try:
+                fragments.append(self._pending.popleft())
+            except IndexError:
+                break
+        if not fragments:
+            return ""
+        logs = "".join(fragments)
+        self._chunk_starts.append(self._total_len)
+        self._chunks.append(logs)
+        self._total_len += len(logs)
+        self._joined = None
+        # Evict whole chunks past the high-water mark. Offsets stay
+        # absolute and monotonic; readers asking for evicted ranges get
+        # a truncation marker instead.
+        if self._total_len - self._chunk_starts[0] > MAX_LOG_BYTES:
+            cut = bisect.bisect_left(
+                self._chunk_starts, self._total_len - MAX_LOG_BYTES
+            )
+            if cut >= len(self._chunks):
+                cut = len(self._chunks) - 1
+            if cut > 0:
+                del self._chunks[:cut]
+                del self._chunk_starts[:cut]
+                self._truncated = True
+        return logs
+
+    def _mirror_tail_locked(self) -> None:
+        """Refresh the synced traitlet with the history tail.
+
+        Mirrors only the tail: syncing the whole history ships O(total)
+        bytes over the comm on every flush. Caller holds _log_lock.
+        """
+        if not self._chunks:
+            self.widget.logs = ""
+            return
+        cutoff = self._total_len - MAX_SYNCED_LOG_BYTES
+        if cutoff <= self._chunk_starts[0]:
+            self.widget.logs = self._join_locked()
+        else:
+            i = bisect.bisect_right(self._chunk_starts, cutoff) - 1
+            tail = "".join(self._chunks[i:])
+            self.widget.logs = tail[cutoff - self._chunk_starts[i] :]
+
+    def _join_locked(self) -> str:
+        """Full history as one string, memoized; caller holds _log_lock."""
+        if self._joined is None:
+            self._joined = "".join(self._chunks)
+        return self._joined
+
     def get_logs(self) -> str:
-        """Get full log history."""
+        """Get the retained log history.
+
+        History is bounded by MAX_LOG_BYTES; once the oldest chunks
+        have been evicted the returned text starts with a truncation
+        marker.
+        """
+        with self._log_lock:
+            self._drain_pending_locked()
+            text = self._join_locked()
+            if self._truncated:
+                return _TRUNCATION_MARKER + text
+            return text
+
+    def get_log_offset(self) -> int:
+        """Absolute byte offset of the end of the log history.
+
+        Pairs with a `get_logs` snapshot so a consumer can keep polling
+        with `get_logs_since` from the right place — the snapshot's own
+        length is not the offset once history has been truncated.
+        """
+        with self._log_lock:
+            self._drain_pending_locked()
+            return self._total_len
+
+    def get_logs_since(self, offset: int) -> Tuple[str, int]:
+        """Get log content appended after a byte offset.
+
+        Offsets below the retained range return no content: pollers
+        track offsets by appending what they receive, so re-delivering
+        retained history here would duplicate text they already
+        displayed. Full snapshots (and the truncation marker) come from
+        `get_logs`.
+
+        Args:
+            offset: Offset the caller has already seen.
+
+        Returns:
+            Tuple of (new content, current total length). The returned
+            offset always equals the absolute history length, so
+            adopting it resynchronizes a poller whose offset drifted.
+        """
         with self._log_lock:
-            return self._log_history
+            self._drain_pending_locked()
+            total = self._total_len
+            if offset >= total or not self._chunks:
+                return "", total
+            if offset < self._chunk_starts[0]:
+                # Requested range starts in evicted history; the caller
+                # adopts the returned total and continues from there.
+                return "", total
+            # First chunk whose range covers the offset
+            i = bisect.bisect_right(self._chunk_starts, offset) - 1
+            text = "".join(self._chunks[i:])
+            return text[offset - self._chunk_starts[i] :], total
 
     def clear_logs(self) -> None:
         """Clear log history."""
         with self._log_lock:
-            self._log_history = ""
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            self._pending.clear()
+            self._chunks.clear()
+            self._chunk_starts.clear()
+            self._total_len = 0
+            self._joined = None
+            self._truncated = False
             self.widget.logs = ""
 
     def send_message(self, message: Dict[str, Any]) -> None:
-        """Send a custom message via widget.send()."""
+        """Send a custom message via widget.send().
+
+        Structural messages flush buffered logs first so the frontend
+        never sees a result or status change ahead of the output that
+        produced it.
+        """
+        if message.get("type") in ("result_ready", "status_change", "run_finished"):
+            self.flush()
         self.widget.send(message)
 
     def prepare_download(
@@ -108,39 +362,131 @@ class StandardTransport(WidgetTransport):
         max_size_mb: float = 50.0,
     ) -> Optional[Dict[str, str]]:
         """Prepare file for download via base64 encoding."""
-        if not file_path.exists():
+        # Open first, then fstat the fd: one syscall pair covers the
+        # existence check, the size check, and the bytes actually read
+        # (no window for the file to change between stat and open). On
+        # FUSE-mounted filesystems (Colab Drive) each extra metadata
+        # call is a real round-trip.
+        try:
+            fd = os.open(str(file_path), os.O_RDONLY)
+        except OSError:
             return None
 
-        size_mb = file_path.stat().st_size / (1024 * 1024)
+        st = os.fstat(fd)
+        size_mb = st.st_size / (1024 * 1024)
 
         if size_mb > max_size_mb:
+            os.close(fd)
             logger.warning(
                 f"File is too large ({size_mb:.1f}MB) for widget download. "
                 "Please use file explorer."
             )
             return None
 
-        with open(file_path, "rb") as f:
-            b64_data = base64.b64encode(f.read()).decode("utf-8")
-
-        # Determine MIME type
-        suffix = file_path.suffix.lower()
-        mime_types = {
-            ".zip": "application/zip",
-            ".gz": "application/gzip",
-            ".tar": "application/x-tar",
-            ".pdf": "application/pdf",
-            ".txt": "text/plain",
-            ".csv": "text/csv",
-            ".json": "application/json",
-        }
-        mime_type = mime_types.get(suffix, "application/octet-stream")
+        mime_type = _MIME_TYPES.get(
+            file_path.suffix.lower(), "application/octet-stream"
+        )
+        prefix = b"data:" + mime_type.encode("ascii") + b";base64,"
+
+        # Encode in chunks into a preallocated buffer that already holds
+        # the data-URI prefix: peak memory stays O(chunk) + O(output),
+        # and the final string needs no format pass over the ~1.33x
+        # encoded payload — just one decode.
+        with os.fdopen(fd, "rb") as f:
+            _advise_sequential(fd)
+            out = bytearray(len(prefix) + ((st.st_size + 2) // 3) * 4)
+            out[: len(prefix)] = prefix
+            offset = len(prefix)
+            # readinto a reused per-thread buffer: the stdlib has no
+            # encode-into, but skipping a fresh bytes object per read
+            # still halves the per-chunk allocations.
+            buf = _read_buffer()
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                encoded = base64.b64encode(view[:n])
+                out[offset : offset + len(encoded)] = encoded
+                offset += len(encoded)
 
         return {
             "name": file_path.name,
-            "data": f"data:{mime_type};base64,{b64_data}",
+            "data": bytes(out[:offset]).decode("ascii"),
         }
 
+    def send_binary(self, meta: Dict[str, Any], payload: bytes) -> None:
+        """Send raw bytes alongside a message using comm binary buffers.
+
+        The widget protocol carries binary buffers natively, so the
+        payload crosses the wire as-is — no base64 (33% size overhead)
+        and no encode/decode pass on either side. The frontend receives
+        it as the first entry in the message's buffer list.
+
+        Args:
+            meta: JSON-serializable message describing the payload.
+            payload: Raw bytes to attach.
+        """
+        self.widget.send(meta, buffers=[payload])
+
+    def send_file_streamed(
+        self,
+        file_path: Path,
+        chunk_bytes: int = _B64_CHUNK_BYTES * 64,
+    ) -> bool:
+        """Send a file to the frontend as a sequence of base64 chunks.
+
+        Unlike `prepare_download`, the file is never materialized as one
+        base64 string on the Python side: each chunk is encoded and sent
+        as a `download_chunk` message, followed by a `download_end`
+        carrying the MIME type. The frontend reassembles the chunks, so
+        there is no size cap on this path.
+
+        Args:
+            file_path: Path to the file to send.
+            chunk_bytes: Raw bytes per message; rounded down to a
+                multiple of 3 so chunks encode without padding.
+
+        Returns:
+            True if the file was sent, False if it does not exist.
+        """
+        chunk_bytes -= chunk_bytes % 3
+        try:
+            f = open(file_path, "rb")
+        except OSError:
+            return False
+
+        name = file_path.name
+        with f:
+            _advise_sequential(f.fileno())
+            seq = 0
+            while True:
+                chunk = f.read(chunk_bytes)
+                if not chunk:
+                    break
+                self.widget.send(
+                    {
+                        "type": "download_chunk",
+                        "name": name,
+                        "seq": seq,
+                        "data": base64.b64encode(chunk).decode("ascii"),
+                    }
+                )
+                seq += 1
+
+        mime_type = _MIME_TYPES.get(
+            file_path.suffix.lower(), "application/octet-stream"
+        )
+        self.widget.send(
+            {
+                "type": "download_end",
+                "name": name,
+                "seq": seq,
+                "mime": mime_type,
+            }
+        )
+        return True
+
     def trigger_download(self, file_path: str) -> bool:
         """Standard transport has no native download - return False."""
         return False
@@ -149,6 +495,24 @@ class StandardTransport(WidgetTransport):
 class ColabTransport(StandardTransport):
     """Google Colab transport with workarounds for traitlet sync issues."""
 
+    def __init__(self, widget: "PipelineWidget") -> None:
+        super().__init__(widget)
+        # Resolve files.download once from the module snapshot;
+        # re-running the import statement per download pays import-lock
+        # and sys.modules overhead each time (and builds an ImportError
+        # outside Colab).
+        try:
+            self._colab_download = _COLAB_MOD.files.download
+        except AttributeError:
+            self._colab_download = None
+
+    def send_binary(self, meta: Dict[str, Any], payload: bytes) -> None:
+        """Fall back to base64-in-message: Colab's comm channel does not
+        deliver binary buffers reliably."""
+        meta = dict(meta)
+        meta["data"] = base64.b64encode(payload).decode("ascii")
+        self.widget.send(meta)
+
     def send_message(self, message: Dict[str, Any]) -> None:
         """Send message with Colab-specific handling.
 
@@ -163,17 +527,31 @@ class ColabTransport(StandardTransport):
 
     def trigger_download(self, file_path: str) -> bool:
         """Use google.colab.files.download() for native download."""
+        if self._colab_download is None:
+            return False
         try:
-            from google.colab import files
-
-            files.download(file_path)
+            self._colab_download(file_path)
             return True
-        except ImportError:
-            return False
         except Exception:
             return False
 
 
+# Environment detection happens once at import: whether we're in Colab
+# can't change mid-session, and widgets may be created in bulk.
+_TRANSPORT_CLS = ColabTransport if _COLAB_MOD is not None else StandardTransport
+
+
+def refresh() -> None:
+    """Re-evaluate the environment detection.
+
+    Only needed by test harnesses that inject or remove a fake
+    google.colab module after this module was imported.
+    """
+    global _COLAB_MOD, _TRANSPORT_CLS
+    _COLAB_MOD = sys.modules.get("google.colab")
+    _TRANSPORT_CLS = ColabTransport if _COLAB_MOD is not None else StandardTransport
+
+
 def create_transport(widget: Any) -> WidgetTransport:
     """Factory to create appropriate transport for current environment.
 
@@ -183,9 +561,4 @@ def create_transport(widget: Any) -> WidgetTransport:
     Returns:
         Appropriate transport for the current environment.
     """
-    import sys
-
-    if "google.colab" in sys.modules:
-        return ColabTransport(widget)
-    else:
-        return StandardTransport(widget)
+    return _TRANSPORT_CLS(widget)